@@ -11,8 +11,16 @@ Upstage API 키 등 관리자만 접근할 수 있는 설정을 관리합니다.
 
 import os
 import json
+import threading
 from pathlib import Path
 
+# 빠른 JSON 파싱 (선택)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 class AdminConfig:
     """관리자 전용 설정 관리"""
 
@@ -34,14 +42,19 @@ class AdminConfig:
         """설정 파일 로드"""
         # 파일에서 로드 시도
         for config_path in self.config_paths:
-            if config_path and config_path.exists():
-                try:
-                    with open(config_path, 'r', encoding='utf-8') as f:
-                        self._config = json.load(f)
-                    print(f"[AdminConfig] 설정 로드됨: {config_path}")
-                    return
-                except Exception as e:
-                    print(f"[AdminConfig] 설정 로드 실패: {e}")
+            if not config_path:
+                continue
+            # exists() 확인 없이 바로 읽기 (파일이 없으면 다음 경로로)
+            try:
+                data = config_path.read_bytes()
+            except FileNotFoundError:
+                continue
+            try:
+                self._config = orjson.loads(data) if HAS_ORJSON else json.loads(data)
+                print(f"[AdminConfig] 설정 로드됨: {config_path}")
+                return
+            except Exception as e:
+                print(f"[AdminConfig] 설정 로드 실패: {e}")
 
         # 환경 변수에서 로드
         self._load_from_env()
@@ -82,10 +95,14 @@ class AdminConfig:
 
 # 싱글톤 인스턴스
 _admin_config = None
+_admin_config_lock = threading.Lock()
 
 def get_admin_config() -> AdminConfig:
-    """관리자 설정 인스턴스 반환"""
+    """관리자 설정 인스턴스 반환 (설정 파일은 프로세스당 한 번만 읽음)"""
     global _admin_config
     if _admin_config is None:
-        _admin_config = AdminConfig()
+        # 여러 변환 스레드가 동시에 처음 호출해도 파일 조회/파싱은 한 번만 수행
+        with _admin_config_lock:
+            if _admin_config is None:
+                _admin_config = AdminConfig()
     return _admin_config
@@ -295,11 +295,35 @@ class PatternStore:
         AI가 수정한 내용과 일치하는 패턴의 사용 횟수 증가
         (AI 검수 결과와 패턴을 매칭하여 호출)
         """
+        self.mark_patterns_used_bulk([(original, corrected, source)])
+
+    def mark_patterns_used_bulk(self, rows: List[Tuple[str, str, Optional[str]]]) -> int:
+        """
+        여러 수정 내용을 한 번에 매칭하여 사용 횟수 증가 (파일 저장 1회)
+
+        Args:
+            rows: [(original, corrected, source), ...] 목록
+
+        Returns:
+            사용 기록된 패턴 수
+        """
+        if not rows:
+            return 0
+
+        # (원본, 수정) 기준 인덱스 - 행마다 전체 패턴을 순회하지 않도록
+        index: Dict[Tuple[str, str], List[ErrorPattern]] = {}
         for pattern in self.patterns.values():
-            if pattern.original == original and pattern.corrected == corrected:
+            index.setdefault((pattern.original, pattern.corrected), []).append(pattern)
+
+        marked = 0
+        for original, corrected, source in rows:
+            for pattern in index.get((original, corrected), ()):
                 if source is None or pattern.source == source:
                     pattern.mark_used()
+                    marked += 1
+
         self._save()
+        return marked
 
     def cleanup(self, max_patterns: int = None, max_per_source: int = None) -> dict:
         """
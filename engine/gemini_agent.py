@@ -15,12 +15,18 @@ import sys
 import json
 import re
 import time
+import queue
+import atexit
+import stat
+import threading
+import hashlib
+from collections import OrderedDict
 from datetime import datetime
-from glob import glob
 from typing import Optional, List, Dict, Any
 
 try:
     import google.generativeai as genai
+    from google.api_core.exceptions import ResourceExhausted
 except ImportError:
     print(json.dumps({
         "type": "error",
@@ -35,6 +41,8 @@ try:
 except ImportError:
     HAS_RULES = False
 
+from rate_limiter import TokenBucket
+
 # 오류 학습 시스템 로드
 try:
     from error_learning import PatternStore
@@ -43,6 +51,81 @@ except ImportError:
     HAS_ERROR_LEARNING = False
 
 
+# ============================================================
+# 로그 출력 (전용 스레드가 모아서 stdout에 기록)
+# ============================================================
+_LOG_BATCH_SIZE = 64
+_LOG_EXIT_TIMEOUT = 5.0  # 종료 시 남은 메시지 출력 대기 시간 (초)
+_LOG_STOP = object()  # 로그 스레드 종료 신호
+_log_queue = queue.Queue()
+_log_thread: Optional[threading.Thread] = None
+_log_thread_lock = threading.Lock()
+
+# 로그 한 줄마다 인코더를 새로 만들지 않도록 재사용 (한글은 이스케이프 없이 UTF-8로 출력)
+_ENC = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+
+
+def _write_log_batch(batch: list):
+    """메시지 묶음을 한 번의 write/flush로 출력 (출력 실패는 무시 - 로그 스레드가 멈추지 않도록)"""
+    try:
+        try:
+            sys.stdout.write(''.join(_ENC(message) + '\n' for message in batch))
+        except UnicodeEncodeError:
+            # UTF-8이 아닌 콘솔에서 직접 실행한 경우 ASCII 이스케이프로 출력
+            sys.stdout.write(''.join(json.dumps(message) + '\n' for message in batch))
+        sys.stdout.flush()
+    except Exception:
+        # Electron이 파이프를 닫은 경우(BrokenPipeError 등) 더 출력할 곳이 없음
+        pass
+
+
+def _log_writer():
+    """큐에 쌓인 메시지를 최대 _LOG_BATCH_SIZE개씩 모아 출력 (_LOG_STOP을 받으면 종료)"""
+    while True:
+        batch = []
+        stop = False
+        message = _log_queue.get()
+        while True:
+            if message is _LOG_STOP:
+                stop = True
+                break
+            batch.append(message)
+            if len(batch) >= _LOG_BATCH_SIZE:
+                break
+            try:
+                message = _log_queue.get_nowait()
+            except queue.Empty:
+                break
+
+        if batch:
+            _write_log_batch(batch)
+        if stop:
+            return
+
+
+def _stop_log_writer():
+    """종료 전 남은 메시지 출력 (스레드가 멈춰 있어도 최대 _LOG_EXIT_TIMEOUT초만 대기)"""
+    _log_queue.put(_LOG_STOP)
+    _log_thread.join(_LOG_EXIT_TIMEOUT)
+
+
+def _start_log_writer():
+    """로그 스레드 시작 (첫 메시지 전송 시 한 번만)"""
+    global _log_thread
+    with _log_thread_lock:
+        if _log_thread is None:
+            _log_thread = threading.Thread(target=_log_writer, name="gemini-agent-log", daemon=True)
+            _log_thread.start()
+            atexit.register(_stop_log_writer)
+
+
+def _emit_json(message: dict):
+    """Electron으로 JSON 메시지 전송 (출력은 로그 스레드가 담당)"""
+    if _log_thread is None:
+        _start_log_writer()
+    _log_queue.put(message)
+
+
 def load_system_prompt() -> str:
     """검수 규칙에서 시스템 프롬프트 생성"""
     if HAS_RULES:
@@ -171,6 +254,29 @@ OCR로 변환된 HTML 문서에서 오류를 찾아 수정합니다.
 """
 
 
+# 응답의 마크다운 코드 블록 (```html ... ```)
+_FENCE_OPEN = re.compile(r'\A```(?:html)?\s*')
+_FENCE_CLOSE = re.compile(r'\s*```\s*\Z')
+
+# 검수 결과 구조화 출력 섹션
+_HTML_SECTION_RE = re.compile(r'===HTML_START===\s*(.*?)\s*===HTML_END===', re.DOTALL)
+_CONFIRMED_SECTION_RE = re.compile(r'===확정_수정_START===\s*(.*?)\s*===확정_수정_END===', re.DOTALL)
+_UNCERTAIN_SECTION_RE = re.compile(r'===검토필요_START===\s*(.*?)\s*===검토필요_END===', re.DOTALL)
+
+# 수정 내역 테이블의 빈 줄/구분선 행 (|---|:---:|)
+_TABLE_SEPARATOR_RE = re.compile(r'[\s|:-]*')
+
+# 소형 파일 묶음 검수 시 문서 구분자
+FILE_DELIMITER = "<<<FILE {index}>>>"
+FILE_DELIMITER_RE = re.compile(r'<<<FILE \d+>>>\s*')
+
+GROUPED_FILES_INSTRUCTION = """여러 문서가 <<<FILE 번호>>> 구분자로 이어져 있습니다.
+각 문서를 서로 독립적으로 검수하세요.
+출력에서도 각 문서의 결과 앞에 입력과 동일한 <<<FILE 번호>>> 구분자를 그대로 붙이고,
+문서마다 위의 출력 형식(HTML, 확정 수정표, 검토필요 수정표)을 모두 포함하세요.
+"""
+
+
 def parse_review_output(output: str) -> dict:
     """
     AI 검수 결과를 파싱하여 구조화된 데이터로 변환
@@ -189,7 +295,7 @@ def parse_review_output(output: str) -> dict:
     }
 
     # HTML 추출
-    html_match = re.search(r'===HTML_START===\s*(.*?)\s*===HTML_END===', output, re.DOTALL)
+    html_match = _HTML_SECTION_RE.search(output)
     if html_match:
         result['html'] = html_match.group(1).strip()
     else:
@@ -197,12 +303,12 @@ def parse_review_output(output: str) -> dict:
         result['html'] = output.strip()
 
     # 확정 수정 추출
-    confirmed_match = re.search(r'===확정_수정_START===\s*(.*?)\s*===확정_수정_END===', output, re.DOTALL)
+    confirmed_match = _CONFIRMED_SECTION_RE.search(output)
     if confirmed_match:
         result['confirmed_corrections'] = parse_correction_table(confirmed_match.group(1))
 
     # 검토 필요 수정 추출
-    uncertain_match = re.search(r'===검토필요_START===\s*(.*?)\s*===검토필요_END===', output, re.DOTALL)
+    uncertain_match = _UNCERTAIN_SECTION_RE.search(output)
     if uncertain_match:
         result['uncertain_corrections'] = parse_correction_table(uncertain_match.group(1))
 
@@ -217,16 +323,15 @@ def parse_correction_table(table_text: str) -> list:
         [{'location': str, 'original': str, 'corrected': str, 'reason': str}, ...]
     """
     corrections = []
-    lines = table_text.strip().split('\n')
 
-    for line in lines:
-        # 테이블 구분선이나 헤더 스킵
-        if not line.strip() or line.startswith('|--') or '위치' in line:
+    for line in table_text.strip().split('\n'):
+        # 빈 줄과 테이블 구분선 스킵
+        if _TABLE_SEPARATOR_RE.fullmatch(line):
             continue
 
-        # 테이블 행 파싱
+        # 테이블 행 파싱 (헤더 행 스킵)
         parts = [p.strip() for p in line.split('|') if p.strip()]
-        if len(parts) >= 4:
+        if len(parts) >= 4 and parts[0] != '위치':
             corrections.append({
                 'location': parts[0],
                 'original': parts[1],
@@ -248,21 +353,32 @@ def track_pattern_usage(corrections: list, source: str = None):
     if not HAS_ERROR_LEARNING:
         return
 
-    try:
-        store = PatternStore()
-
-        for corr in corrections:
-            original = corr.get('original', '')
-            corrected = corr.get('corrected', '')
+    rows = [
+        (corr.get('original', ''), corr.get('corrected', ''), source)
+        for corr in corrections
+        if corr.get('original') and corr.get('corrected')
+    ]
+    if not rows:
+        return
 
-            if original and corrected:
-                store.mark_patterns_used_by_content(original, corrected, source)
+    try:
+        # 전체 수정 목록을 한 번에 기록 (패턴 파일 저장 1회)
+        PatternStore().mark_patterns_used_bulk(rows)
 
     except Exception as e:
         # 패턴 추적 실패는 무시 (검수 본연의 기능에 영향 없음)
         pass
 
 
+def _chunk_text(chunk) -> str:
+    """스트리밍 응답 조각의 텍스트 (본문이 없는 조각은 빈 문자열)"""
+    try:
+        return chunk.text
+    except ValueError:
+        # 안전 필터/종료 신호만 담긴 조각은 .text 접근 시 ValueError 발생
+        return ''
+
+
 # ============================================================
 # Gemini Agent 클래스
 # ============================================================
@@ -278,7 +394,20 @@ class GeminiReviewAgent:
 
     # 토큰 제한 (안전 마진 포함)
     MAX_INPUT_TOKENS = 900000  # 1M 토큰 모델 기준
-    CHUNK_SIZE = 30000  # 문자 단위 청크 크기
+    MAX_OUTPUT_TOKENS = 8192  # 검수 결과는 HTML 전체를 다시 출력하므로 실질적 상한
+    TOKEN_BUDGET_RATIO = 0.9  # 토큰 예산 중 청크에 사용할 비율
+    CHUNK_SIZE = 30000  # 문자 단위 청크 크기 (토큰 계산 실패 시 기본값)
+    BATCH_MARGIN = 2000  # 소형 파일 묶음 시 구분자/교정표 여유분 (토큰)
+
+    # 요청 속도 제한 (토큰 버킷) 및 429 재시도
+    RATE_LIMIT_RPM = 60
+    RATE_LIMIT_BURST = 10
+    MAX_RETRIES = 3
+
+    # 토큰 수 캐시 (모델 ID, sha256(문서)) → 토큰 수 (문서 본문은 보관하지 않음, 인스턴스 간 공유)
+    TOKEN_CACHE_SIZE = 256
+    _token_cache: "OrderedDict[tuple, int]" = OrderedDict()
+    _token_cache_lock = threading.Lock()
 
     def __init__(self, api_key: str, model_name: str = "flash-2.0"):
         self.api_key = api_key
@@ -287,13 +416,16 @@ class GeminiReviewAgent:
         # API 설정
         genai.configure(api_key=api_key)
 
+        # 요청 속도 제한기 (고정 sleep 대신 토큰이 부족할 때만 대기)
+        self.rate_bucket = TokenBucket(rate_per_minute=self.RATE_LIMIT_RPM, burst=self.RATE_LIMIT_BURST)
+
         # 모델 초기화
         self.model = genai.GenerativeModel(
             model_name=self.model_id,
             generation_config={
                 "temperature": 0.1,  # 정확성 최우선
                 "top_p": 0.95,
-                "max_output_tokens": 8192
+                "max_output_tokens": self.MAX_OUTPUT_TOKENS
             },
             safety_settings=[
                 {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
@@ -303,6 +435,66 @@ class GeminiReviewAgent:
             ]
         )
 
+    def _count_tokens(self, content: str) -> int:
+        """
+        모델 토크나이저로 토큰 수 계산 (원격 호출이므로 요청 속도 제한 적용)
+
+        같은 문서는 다시 계산하지 않도록 문서 해시 기준으로 토큰 수만 캐시합니다.
+        """
+        cache_key = (self.model_id, hashlib.sha256(content.encode('utf-8')).digest())
+        with self._token_cache_lock:
+            cached = self._token_cache.get(cache_key)
+            if cached is not None:
+                self._token_cache.move_to_end(cache_key)
+                return cached
+
+        self.rate_bucket.acquire()
+        total_tokens = self.model.count_tokens(content).total_tokens
+
+        with self._token_cache_lock:
+            self._token_cache[cache_key] = total_tokens
+            if len(self._token_cache) > self.TOKEN_CACHE_SIZE:
+                self._token_cache.popitem(last=False)
+        return total_tokens
+
+    def _token_budget(self) -> float:
+        """청크/묶음 하나에 사용할 토큰 예산"""
+        return min(self.MAX_INPUT_TOKENS, self.MAX_OUTPUT_TOKENS) * self.TOKEN_BUDGET_RATIO
+
+    def _chunk_char_limit(self, content: str) -> int:
+        """
+        실제 토큰 수 기준 청크 크기(문자 수) 계산
+
+        문서 전체 토큰 수로 문자/토큰 비율을 구한 뒤,
+        토큰 예산의 90%에 해당하는 문자 수를 청크 크기로 사용
+        """
+        budget = self._token_budget()
+
+        # 토큰 하나는 UTF-8 1바이트 이상이므로 바이트 수가 예산 이하면 토큰 계산 없이 통과
+        # (문자 수 ≤ 바이트 수 ≤ 예산이므로 분할되지 않음)
+        if len(content) <= budget and len(content.encode('utf-8')) <= budget:
+            return int(budget)
+
+        try:
+            total_tokens = self._count_tokens(content)
+        except Exception:
+            return self.CHUNK_SIZE
+
+        if total_tokens <= 0:
+            return self.CHUNK_SIZE
+
+        chars_per_token = len(content) / total_tokens
+        return max(1, int(budget * chars_per_token))
+
+    def _group_byte_limit(self) -> int:
+        """
+        소형 파일 묶음 크기 제한(바이트) 계산
+
+        묶기 전에는 내용을 읽지 않으므로 토큰 하나 ≥ 1바이트 기준으로
+        토큰 예산에서 여유분을 뺀 값을 바이트 제한으로 사용 (출력 토큰 예산 초과 방지)
+        """
+        return max(1, int(self._token_budget()) - self.BATCH_MARGIN)
+
     def review_document(self, content: str) -> dict:
         """
         단일 문서 검수
@@ -317,16 +509,17 @@ class GeminiReviewAgent:
                 'uncertain_corrections': 검토 필요 수정 목록
             }
         """
-        # 문서가 너무 길면 청크로 분할
-        if len(content) > self.CHUNK_SIZE:
-            return self._review_chunked(content)
+        # 문서가 토큰 예산을 넘으면 청크로 분할
+        chunk_size = self._chunk_char_limit(content)
+        if len(content) > chunk_size:
+            return self._review_chunked(content, chunk_size)
 
         return self._call_gemini(content)
 
-    def _review_chunked(self, content: str) -> dict:
+    def _review_chunked(self, content: str, chunk_size: int = None) -> dict:
         """대용량 문서 청크 처리"""
         # HTML을 논리적 단위로 분할 (주요 태그 기준)
-        chunks = self._split_html(content)
+        chunks = self._split_html(content, chunk_size or self.CHUNK_SIZE)
         reviewed_html_parts = []
         all_confirmed = []
         all_uncertain = []
@@ -337,7 +530,6 @@ class GeminiReviewAgent:
             reviewed_html_parts.append(result.get('html', chunk))
             all_confirmed.extend(result.get('confirmed_corrections', []))
             all_uncertain.extend(result.get('uncertain_corrections', []))
-            time.sleep(0.5)  # Rate limit 방지
 
         return {
             'html': ''.join(reviewed_html_parts),
@@ -345,8 +537,9 @@ class GeminiReviewAgent:
             'uncertain_corrections': all_uncertain
         }
 
-    def _split_html(self, content: str) -> List[str]:
+    def _split_html(self, content: str, chunk_size: int = None) -> List[str]:
         """HTML을 논리적 청크로 분할"""
+        chunk_size = chunk_size or self.CHUNK_SIZE
         chunks = []
         current_chunk = ""
 
@@ -356,7 +549,7 @@ class GeminiReviewAgent:
         parts = split_pattern.split(content)
 
         for part in parts:
-            if len(current_chunk) + len(part) > self.CHUNK_SIZE:
+            if len(current_chunk) + len(part) > chunk_size:
                 if current_chunk:
                     chunks.append(current_chunk)
                 current_chunk = part
@@ -381,39 +574,9 @@ class GeminiReviewAgent:
             }
         """
         try:
-            # 검수 규칙에서 시스템 프롬프트 로드
-            system_prompt = load_system_prompt()
-
-            prompt = f"""{system_prompt}
-
----
-
-## 검수할 문서
-
-{content}
-
----
-
-위 문서에서 OCR 오류를 찾아 수정하세요.
-HTML 태그는 그대로 유지하고 텍스트 오류만 수정합니다.
-
-중요:
-- HTML 본문에는 확실한 수정과 불확실한 수정을 모두 적용하세요
-- 확정 수정표에는 확실한 수정만 기재하세요
-- 검토필요 수정표에는 불확실한 수정(고유명사, 맥락상 애매한 경우 등)을 기재하세요
-
-반드시 위의 출력 형식을 따라주세요.
-"""
-
-            response = self.model.generate_content(prompt)
-
-            if response.text:
-                # 마크다운 코드 블록 제거
-                raw_result = response.text
-                raw_result = re.sub(r'^```html\s*', '', raw_result)
-                raw_result = re.sub(r'^```\s*', '', raw_result)
-                raw_result = re.sub(r'\s*```$', '', raw_result)
+            raw_result = self._generate(self._build_prompt(content))
 
+            if raw_result:
                 # 구조화된 출력 파싱
                 parsed = parse_review_output(raw_result)
                 parsed['raw_response'] = raw_result
@@ -446,18 +609,251 @@ HTML 태그는 그대로 유지하고 텍스트 오류만 수정합니다.
                 'error': str(e)
             }
 
+    def _build_prompt(self, content: str, extra_instruction: str = "") -> str:
+        """검수 요청 프롬프트 구성"""
+        # 검수 규칙에서 시스템 프롬프트 로드
+        system_prompt = load_system_prompt()
+
+        return f"""{system_prompt}
+
+---
+
+## 검수할 문서
+
+{content}
+
+---
+
+위 문서에서 OCR 오류를 찾아 수정하세요.
+HTML 태그는 그대로 유지하고 텍스트 오류만 수정합니다.
+
+중요:
+- HTML 본문에는 확실한 수정과 불확실한 수정을 모두 적용하세요
+- 확정 수정표에는 확실한 수정만 기재하세요
+- 검토필요 수정표에는 불확실한 수정(고유명사, 맥락상 애매한 경우 등)을 기재하세요
+{extra_instruction}
+반드시 위의 출력 형식을 따라주세요.
+"""
+
+    def _generate(self, prompt: str) -> str:
+        """Gemini 스트리밍 호출 후 마크다운 코드 블록을 제거한 응답 텍스트 반환"""
+        for attempt in range(self.MAX_RETRIES):
+            self.rate_bucket.acquire()
+            try:
+                # 스트리밍 수신: 생성되는 대로 조각을 모아 응답 완료 대기 시간과 중간 버퍼를 줄임
+                # (429는 스트림 순회 중에도 발생할 수 있으므로 순회까지 재시도 범위에 포함)
+                pieces = []
+                for chunk in self.model.generate_content(prompt, stream=True):
+                    text = _chunk_text(chunk)
+                    if text:
+                        pieces.append(text)
+                break
+            except ResourceExhausted:
+                # 429: 버킷을 비워 다른 요청도 늦추고 지수 백오프 후 재시도
+                if attempt == self.MAX_RETRIES - 1:
+                    raise
+                self.rate_bucket.penalize()
+                self._emit_progress(f"Rate limit (429), {2 ** attempt}초 대기 후 재시도...")
+                time.sleep(2 ** attempt)
+
+        raw_result = ''.join(pieces)
+        if not raw_result:
+            return ''
+
+        # 마크다운 코드 블록 제거
+        raw_result = _FENCE_OPEN.sub('', raw_result)
+        raw_result = _FENCE_CLOSE.sub('', raw_result)
+        return raw_result.strip()
+
+    def review_documents(self, contents: List[str]) -> List[dict]:
+        """
+        여러 소형 문서를 한 번의 API 호출로 묶어 검수
+
+        각 문서를 <<<FILE i>>> 구분자로 이어 붙여 요청하고 응답을 같은 구분자로 나눕니다.
+        응답의 문서 수가 맞지 않거나 호출이 실패하면 문서별로 개별 검수합니다.
+
+        Returns:
+            문서 순서와 같은 순서의 검수 결과 목록 (review_document와 동일한 형식)
+        """
+        if len(contents) == 1:
+            return [self.review_document(contents[0])]
+
+        combined = ''.join(
+            f"\n{FILE_DELIMITER.format(index=i)}\n{content}"
+            for i, content in enumerate(contents)
+        )
+
+        try:
+            raw_result = self._generate(self._build_prompt(combined, GROUPED_FILES_INSTRUCTION))
+            parts = FILE_DELIMITER_RE.split(raw_result)[1:]
+        except Exception as e:
+            self._emit_progress(f"묶음 검수 실패, 개별 검수로 전환 ({type(e).__name__}): {str(e)}")
+            parts = []
+
+        if len(parts) != len(contents):
+            if parts:
+                self._emit_progress(
+                    f"묶음 응답 문서 수 불일치 ({len(parts)}/{len(contents)}), 개별 검수로 전환"
+                )
+            return [self.review_document(content) for content in contents]
+
+        results = []
+        for part in parts:
+            parsed = parse_review_output(part)
+            parsed['raw_response'] = part
+            results.append(parsed)
+        return results
+
     def _emit_progress(self, msg: str):
         """진행 상황 출력"""
-        print(json.dumps({"type": "log", "msg": msg}), flush=True)
+        _emit_json({"type": "log", "msg": msg})
 
     def _emit_error(self, msg: str):
         """오류 출력"""
-        print(json.dumps({"type": "error", "msg": msg}), flush=True)
+        _emit_json({"type": "error", "msg": msg})
 
 
 # ============================================================
 # 배치 처리
 # ============================================================
+# 파이프라인 설정
+REVIEW_WORKERS = 2  # 동시 API 호출 스레드 수 (요청 속도는 토큰 버킷이 제한)
+READ_QUEUE_SIZE = 4  # 미리 읽어 둘 문서 그룹 수
+
+def collect_html_files(input_dir: str) -> Dict[str, int]:
+    """
+    검수 대상 HTML 파일 수집 (디렉토리 1회 순회)
+
+    - 새 구조: Converted_HTML/{doc_name}/view.html
+    - 기존 구조: Converted_HTML/*.html
+
+    Returns:
+        {파일 경로: 파일 크기(바이트)} - 정렬/묶음 시 stat을 다시 호출하지 않도록 함께 수집
+    """
+    html_files = {}
+
+    with os.scandir(input_dir) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                view_path = os.path.join(entry.path, "view.html")
+                try:
+                    st = os.stat(view_path)
+                except OSError:
+                    continue
+                if stat.S_ISREG(st.st_mode):
+                    html_files[view_path] = st.st_size
+            elif entry.name.endswith('.html'):
+                html_files[entry.path] = entry.stat().st_size
+
+    return html_files
+
+
+def review_output_name(file_path: str) -> str:
+    """
+    검수 결과 파일명 (문서 단위)
+
+    - 새 구조: Converted_HTML/{doc_name}/view.html → {doc_name}.html
+    - 기존 구조: Converted_HTML/{name}.html → {name}.html
+    """
+    if os.path.basename(file_path) == "view.html":
+        return os.path.basename(os.path.dirname(file_path)) + ".html"
+    return os.path.basename(file_path)
+
+
+def group_small_files(file_paths: List[str], size_limit: int,
+                      file_sizes: Optional[Dict[str, int]] = None) -> List[List[str]]:
+    """
+    인접한 소형 파일을 size_limit 이하로 묶음
+
+    파일 크기(바이트)는 토큰 수 이상이므로 토큰 단위 제한에 대해 보수적인 기준입니다.
+    size_limit 이상인 파일은 단독 그룹이 되어 기존처럼 (필요 시 청크 분할) 검수됩니다.
+    file_sizes가 주어지면 파일 크기를 다시 조회하지 않습니다.
+    """
+    groups = []
+    current = []
+    current_size = 0
+
+    for file_path in file_paths:
+        size = file_sizes[file_path] if file_sizes else os.path.getsize(file_path)
+
+        if size >= size_limit:
+            if current:
+                groups.append(current)
+                current, current_size = [], 0
+            groups.append([file_path])
+            continue
+
+        if current and current_size + size > size_limit:
+            groups.append(current)
+            current, current_size = [], 0
+
+        current.append(file_path)
+        current_size += size
+
+    if current:
+        groups.append(current)
+
+    return groups
+
+
+def _save_review_result(output_dir: str, filename: str, content: str, result: dict, elapsed: float) -> list:
+    """
+    검수 결과(HTML, 수정 내역 JSON) 저장 및 진행 상황 출력
+
+    Returns:
+        패턴 사용 기록 대상 수정 목록 (배치 종료 시 일괄 기록)
+    """
+    output_path = os.path.join(output_dir, filename)
+    corrections_path = os.path.join(output_dir, filename.replace('.html', '_corrections.json'))
+
+    # HTML 저장
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(result.get('html', content))
+
+    # 수정 내역 저장 (JSON)
+    confirmed = result.get('confirmed_corrections', [])
+    uncertain = result.get('uncertain_corrections', [])
+
+    corrections_data = {
+        'file': filename,
+        'reviewed_at': datetime.now().isoformat(),
+        'confirmed_corrections': confirmed,
+        'uncertain_corrections': uncertain,
+        'stats': {
+            'confirmed_count': len(confirmed),
+            'uncertain_count': len(uncertain)
+        }
+    }
+    with open(corrections_path, 'w', encoding='utf-8') as f:
+        json.dump(corrections_data, f, ensure_ascii=False, indent=2)
+
+    # 검토 필요 항목 수
+    uncertain_count = len(uncertain)
+
+    _emit_json({
+        "type": "progress",
+        "status": "success",
+        "file": filename,
+        "time": elapsed,
+        "confirmed_count": len(confirmed),
+        "uncertain_count": uncertain_count,
+        "needs_review": uncertain_count > 0
+    })
+
+    return confirmed + uncertain
+
+
+
+def _emit_file_failure(filename: str, error: Exception):
+    """파일 단위 실패 출력"""
+    _emit_json({
+        "type": "progress",
+        "status": "fail",
+        "file": filename,
+        "error": str(error)
+    })
+
+
 def batch_review(folder_path: str, api_key: str, model_name: str = "flash-2.0"):
     """
     폴더 내 모든 문서 배치 검수
@@ -472,34 +868,31 @@ def batch_review(folder_path: str, api_key: str, model_name: str = "flash-2.0"):
     output_dir = os.path.join(folder_path, "Final_Reviewed_Gemini")
 
     if not os.path.exists(input_dir):
-        print(json.dumps({
+        _emit_json({
             "type": "error",
             "msg": f"입력 폴더가 없습니다: {input_dir}"
-        }), flush=True)
+        })
         return
 
     os.makedirs(output_dir, exist_ok=True)
 
-    # HTML 파일 목록 (새 구조: Converted_HTML/{doc_name}/view.html)
-    html_files = glob(os.path.join(input_dir, "*", "view.html"))
-
-    # 기존 구조도 지원 (Converted_HTML/*.html)
-    html_files.extend(glob(os.path.join(input_dir, "*.html")))
+    # HTML 파일 목록
+    html_files = collect_html_files(input_dir)
 
     if not html_files:
-        print(json.dumps({
+        _emit_json({
             "type": "warning",
             "msg": "검수할 HTML 파일이 없습니다"
-        }), flush=True)
+        })
         return
 
     # 초기화 메시지
-    print(json.dumps({
+    _emit_json({
         "type": "init",
         "total": len(html_files),
         "model": model_name,
         "output_dir": output_dir
-    }), flush=True)
+    })
 
     # 에이전트 초기화
     agent = GeminiReviewAgent(api_key=api_key, model_name=model_name)
@@ -507,98 +900,152 @@ def batch_review(folder_path: str, api_key: str, model_name: str = "flash-2.0"):
     # 통계
     stats = {"success": 0, "fail": 0, "skipped": 0}
 
+    # 이미 검수된 문서 스킵 (파일별 exists() 대신 출력 폴더 목록을 한 번만 조회)
+    # 새 구조는 모든 입력 파일명이 view.html이므로 문서 단위 결과 파일명으로 비교
+    reviewed_files = set(os.listdir(output_dir))
+    pending_files = []
     for file_path in html_files:
-        filename = os.path.basename(file_path)
-        output_path = os.path.join(output_dir, filename)
-        corrections_path = os.path.join(output_dir, filename.replace('.html', '_corrections.json'))
-
-        try:
-            # 이미 검수된 파일 스킵
-            if os.path.exists(output_path):
-                print(json.dumps({
-                    "type": "progress",
-                    "status": "skipped",
-                    "file": filename,
-                    "msg": "이미 검수 완료"
-                }), flush=True)
-                stats["skipped"] += 1
-                continue
-
-            # 문서 읽기
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # 검수 실행
-            start_time = time.time()
-            result = agent.review_document(content)
-            elapsed = round(time.time() - start_time, 2)
-
-            # HTML 저장
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(result.get('html', content))
-
-            # 수정 내역 저장 (JSON)
-            confirmed = result.get('confirmed_corrections', [])
-            uncertain = result.get('uncertain_corrections', [])
-
-            corrections_data = {
-                'file': filename,
-                'reviewed_at': datetime.now().isoformat(),
-                'confirmed_corrections': confirmed,
-                'uncertain_corrections': uncertain,
-                'stats': {
-                    'confirmed_count': len(confirmed),
-                    'uncertain_count': len(uncertain)
-                }
-            }
-            with open(corrections_path, 'w', encoding='utf-8') as f:
-                json.dump(corrections_data, f, ensure_ascii=False, indent=2)
-
-            # 학습된 패턴 사용 기록 (확정 수정만)
-            all_corrections = confirmed + uncertain
-            if all_corrections:
-                track_pattern_usage(all_corrections)
-
-            # 검토 필요 항목 수
-            uncertain_count = len(result.get('uncertain_corrections', []))
-
-            print(json.dumps({
+        filename = review_output_name(file_path)
+        if filename in reviewed_files:
+            _emit_json({
                 "type": "progress",
-                "status": "success",
+                "status": "skipped",
                 "file": filename,
-                "time": elapsed,
-                "confirmed_count": len(result.get('confirmed_corrections', [])),
-                "uncertain_count": uncertain_count,
-                "needs_review": uncertain_count > 0
-            }), flush=True)
-
-            stats["success"] += 1
+                "msg": "이미 검수 완료"
+            })
+            stats["skipped"] += 1
+        else:
+            pending_files.append(file_path)
+
+    # 큰 파일부터 처리 (오래 걸리는 작업을 먼저 시작해 마지막에 한 파일만 남는 상황 방지)
+    pending_files.sort(key=html_files.__getitem__, reverse=True)
+
+    # 소형 파일은 묶어서 한 번에 검수 (요청 수 및 시스템 프롬프트 토큰 절감)
+    groups = group_small_files(pending_files, agent._group_byte_limit(), html_files)
+
+    # 읽기 → API 호출 → 저장 파이프라인 (디스크 I/O를 네트워크 대기 시간에 겹침)
+    read_queue = queue.Queue(maxsize=READ_QUEUE_SIZE)
+    write_queue = queue.Queue()
+    stats_lock = threading.Lock()
+    pending_corrections = []  # 패턴 사용 기록 대상 (배치 종료 시 일괄 기록)
+
+    def count(key: str):
+        with stats_lock:
+            stats[key] += 1
+
+    def read_stage():
+        """문서 읽기"""
+        for group in groups:
+            contents = []
+            readable = []
+            for file_path in group:
+                try:
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        contents.append(f.read())
+                    readable.append(file_path)
+                except Exception as e:
+                    _emit_file_failure(review_output_name(file_path), e)
+                    count("fail")
+
+            if readable:
+                read_queue.put((readable, contents))
+
+        for _ in range(REVIEW_WORKERS):
+            read_queue.put(None)
+
+    def review_stage():
+        """검수 실행 (API 호출)"""
+        while True:
+            item = read_queue.get()
+            if item is None:
+                return
+
+            readable, contents = item
+            try:
+                start_time = time.time()
+                results = agent.review_documents(contents)
+                elapsed = round(time.time() - start_time, 2)
+            except Exception as e:
+                for file_path in readable:
+                    _emit_file_failure(review_output_name(file_path), e)
+                    count("fail")
+                continue
 
-            # Rate limit 방지
-            time.sleep(1)
-
-        except Exception as e:
-            print(json.dumps({
-                "type": "progress",
-                "status": "fail",
-                "file": filename,
-                "error": str(e)
-            }), flush=True)
-            stats["fail"] += 1
+            write_queue.put((readable, contents, results, elapsed))
+
+    def write_stage():
+        """검수 결과 저장"""
+        while True:
+            item = write_queue.get()
+            if item is None:
+                return
+
+            readable, contents, results, elapsed = item
+            for file_path, content, result in zip(readable, contents, results):
+                filename = review_output_name(file_path)
+                try:
+                    pending_corrections.extend(
+                        _save_review_result(output_dir, filename, content, result, elapsed)
+                    )
+                    count("success")
+                except Exception as e:
+                    _emit_file_failure(filename, e)
+                    count("fail")
+
+    reader = threading.Thread(target=read_stage, name="review-reader")
+    reviewers = [
+        threading.Thread(target=review_stage, name=f"review-worker-{i}")
+        for i in range(REVIEW_WORKERS)
+    ]
+    writer = threading.Thread(target=write_stage, name="review-writer")
+
+    for thread in [reader, writer] + reviewers:
+        thread.start()
+
+    reader.join()
+    for thread in reviewers:
+        thread.join()
+    write_queue.put(None)
+    writer.join()
+
+    # 학습된 패턴 사용 기록 (배치 전체를 한 번에 저장)
+    track_pattern_usage(pending_corrections)
 
     # 완료 메시지
-    print(json.dumps({
+    _emit_json({
         "type": "complete",
         "success": stats["success"],
         "fail": stats["fail"],
         "skipped": stats["skipped"],
         "output_dir": output_dir
-    }), flush=True)
+    })
 
 
 # ============================================================
 # 단일 파일 처리
 # ============================================================
+_agent_instance: Optional[GeminiReviewAgent] = None
+_agent_key: Optional[tuple] = None
+
+
+def _get_agent(api_key: str, model_name: str) -> GeminiReviewAgent:
+    """
+    가장 최근 (API 키, 모델)의 에이전트 재사용
+
+    모델/클라이언트 생성 비용을 반복하지 않도록 마지막 에이전트 하나만 캐시합니다.
+    genai.configure()는 프로세스 전역 설정이라 그 사이 다른 키로 설정되었을 수 있으므로
+    재사용할 때마다 이 에이전트의 키로 다시 설정합니다.
+    """
+    global _agent_instance, _agent_key
+    key = (api_key, model_name)
+    if _agent_instance is None or _agent_key != key:
+        _agent_instance = GeminiReviewAgent(api_key=api_key, model_name=model_name)
+        _agent_key = key
+    else:
+        genai.configure(api_key=api_key)
+    return _agent_instance
+
+
 def review_single_file(file_path: str, api_key: str, model_name: str = "flash-2.0") -> dict:
     """
     단일 파일 검수
@@ -610,12 +1057,10 @@ def review_single_file(file_path: str, api_key: str, model_name: str = "flash-2.
             'uncertain_corrections': 검토 필요 수정 목록
         }
     """
-    agent = GeminiReviewAgent(api_key=api_key, model_name=model_name)
-
     with open(file_path, 'r', encoding='utf-8') as f:
         content = f.read()
 
-    return agent.review_document(content)
+    return _get_agent(api_key, model_name).review_document(content)
 
 
 # ============================================================
@@ -623,10 +1068,10 @@ def review_single_file(file_path: str, api_key: str, model_name: str = "flash-2.
 # ============================================================
 if __name__ == "__main__":
     if len(sys.argv) < 3:
-        print(json.dumps({
+        _emit_json({
             "type": "error",
             "msg": "사용법: python gemini_agent.py <폴더경로> <API키> [모델명]"
-        }), flush=True)
+        })
         sys.exit(1)
 
     folder_path = sys.argv[1]
@@ -17,9 +17,14 @@ import sys
 import json
 import re
 import time
+import asyncio
+import threading
+import functools
+import hashlib
 import base64
 import mimetypes
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple, Callable
 
 # Gemini SDK 로드 (google-genai)
 try:
@@ -29,6 +34,26 @@ try:
 except ImportError:
     HAS_GENAI = False
 
+# 빠른 JSON 직렬화 (선택)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# 로컬 토크나이저 (선택, 청크 크기를 토큰 수로 측정)
+try:
+    import tiktoken
+    HAS_TIKTOKEN = True
+except ImportError:
+    HAS_TIKTOKEN = False
+
+from rate_limiter import TokenBucket
+
+# 모든 교정 요청(스레드/청크/문서)이 공유하는 요청 속도 제한기
+_bucket = TokenBucket(rate_per_minute=60, burst=10)
+RATE_LIMIT_SLOWDOWN = 30  # 429 발생 시 요청 속도를 절반으로 낮추는 시간 (초)
+
 
 # ============================================================
 # 교정 프롬프트: 원본 파일 대조 가능한 경우 (PDF, 이미지)
@@ -154,25 +179,122 @@ HTML 태그와 구조는 그대로 유지하고, 텍스트만 수정하세요.
 교정된 HTML만 출력하세요 (설명 없이)."""
 
 
+# ============================================================
+# 요청 마무리 지시문
+# ============================================================
+CORRECTION_SUFFIX_WITH_ORIGINAL = "위 HTML을 원본 문서와 비교하여 교정된 HTML을 출력하세요.\n절대로 하나도 빠트리지 말고 전체를 정밀하게 검토하세요.\nHTML 구조와 태그를 절대 변경하지 말고, 텍스트 오류만 수정하세요."
+
+CORRECTION_SUFFIX_TEXT_ONLY = "위 HTML의 텍스트를 정밀하게 교정하여 교정된 HTML을 출력하세요.\n절대로 하나도 빠트리지 말고 전체를 정밀하게 검토하세요.\nHTML 구조와 태그를 절대 변경하지 말고, 텍스트 오류만 수정하세요."
+
+# 원본 대조 여부별 프롬프트 (전체 교정, 마무리 지시문, 청크 교정)
+PROMPT_SETS = {
+    True: (CORRECTION_WITH_ORIGINAL_PROMPT, CORRECTION_SUFFIX_WITH_ORIGINAL, CORRECTION_CHUNK_WITH_ORIGINAL),
+    False: (CORRECTION_TEXT_ONLY_PROMPT, CORRECTION_SUFFIX_TEXT_ONLY, CORRECTION_CHUNK_TEXT_ONLY),
+}
+
+
 # 원본 대조 가능한 파일 확장자
-ORIGINAL_COMPARABLE_EXTENSIONS = (
-    '.pdf',
-    '.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif', '.gif', '.webp'
+_IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif', '.gif', '.webp'})
+ORIGINAL_COMPARABLE_EXTENSIONS = _IMAGE_EXTENSIONS | {'.pdf'}
+
+
+@functools.lru_cache(maxsize=1)
+def _get_token_encoding():
+    """
+    청크 크기 측정용 토크나이저 (미설치/로드 실패 시 None)
+
+    Gemini 토크나이저는 로컬에서 쓸 수 없으므로 cl100k_base를 근사치로 사용합니다.
+    (원격 count_tokens는 경계마다 네트워크 왕복이 필요)
+    """
+    if not HAS_TIKTOKEN:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=64)
+def _guess_mime_type(ext: str) -> str:
+    """확장자별 이미지 MIME 타입 (확장자 단위로 캐시)"""
+    return mimetypes.guess_type('file' + ext)[0] or "image/png"
+
+# 응답 마크다운 코드 블록 제거 패턴 (앞/뒤 펜스를 한 번의 치환으로 처리)
+_FENCE_ANY_RE = re.compile(r'\A```(?:html)?\s*\n?|\n?```\s*\Z')
+
+# 태그 제거 (보이는 텍스트 길이 측정용)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# OCR 오류 의심 패턴 (한글 단어 안의 영문/숫자 혼입, "가"→"71", "이"→"0/l", 깨진 문자)
+_SUSPECT_RE = re.compile(
+    r'[A-Za-z]{1,2}(?=[가-힣])|(?<=[가-힣])[A-Za-z]{1,2}|[0-9][가-힣]|[가-힣][0-9]|71|0/l|\ufffd'
 )
 
+# HTML 청크 분할용 블록 태그 (중첩 깊이 추적)
+_BLOCK_TAG_RE = re.compile(r'<(/?)(div|table|section|article)\b[^>]*>|<hr[^>]*>', re.IGNORECASE)
+
+
+# 429 오류의 서버 권장 재시도 대기 시간 (RetryInfo, 예: 'retryDelay': '17s')
+_RETRY_DELAY_RE = re.compile(r'retry_?delay\W+(\d+(?:\.\d+)?)s', re.IGNORECASE)
+
+
+def _server_retry_delay(error: Exception) -> Optional[float]:
+    """429 오류 메시지에서 서버가 지정한 재시도 대기 시간 추출 (초, 없으면 None)"""
+    match = _RETRY_DELAY_RE.search(str(error))
+    return float(match.group(1)) if match else None
+
+
+def _strip_code_fence(text: str) -> str:
+    """응답 앞뒤의 마크다운 코드 블록 제거"""
+    text = text.strip()
+    # 대부분의 응답은 코드 블록이 없으므로 정규식 없이 바로 반환
+    if not text.startswith('```') and not text.endswith('```'):
+        return text
+    return _FENCE_ANY_RE.sub('', text).strip()
+
 
 def _emit_log(msg: str, log_type: str = "log"):
     """로그 메시지 출력 (stderr로 Electron에 전달)"""
-    print(json.dumps({"type": log_type, "msg": msg}), file=sys.stderr, flush=True)
+    message = {"type": log_type, "msg": msg}
+
+    # orjson: UTF-8 바이트를 바로 만들어 텍스트 인코딩 단계 없이 기록
+    stream = getattr(sys.stderr, 'buffer', None)
+    if HAS_ORJSON and stream is not None:
+        stream.write(orjson.dumps(message) + b'\n')
+        stream.flush()
+        return
+
+    print(json.dumps(message, ensure_ascii=False), file=sys.stderr, flush=True)
 
 
 class GeminiCorrector:
     """Gemini 3.0 Flash를 이용한 HTML 교정기"""
 
     MODEL_NAME = "gemini-3-flash-preview"
-    CHUNK_SIZE = 25000  # 문자 단위 청크 크기
+    CHUNK_SIZE = 25000  # 문자 단위 청크 크기 (토크나이저가 없을 때)
+    CHUNK_TOKENS = 20000  # 토큰 단위 청크 크기
     MAX_RETRIES = 3
     RETRY_DELAY = 2  # 초
+    MAX_CONCURRENCY = 4  # 청크 동시 교정 요청 수
+    UPLOAD_POLL_MIN = 0.2  # 업로드 처리 상태 확인 간격 (초, 최소)
+    UPLOAD_POLL_MAX = 2.0  # 업로드 처리 상태 확인 간격 (초, 최대)
+    # 인라인 데이터는 base64(약 4/3배)로 요청 본문(최대 4MB)에 포함되므로 여유를 두고 제한
+    INLINE_IMAGE_LIMIT = 2 * 1024 * 1024  # 이 크기를 넘는 이미지는 인라인 대신 파일 업로드
+    MAX_UPLOAD_SIZE = 2 * 1024 * 1024 * 1024  # Files API 파일당 최대 크기 (2GB)
+    MIN_CORRECT_CHARS = 200  # 보이는 텍스트가 이보다 짧으면 교정 생략
+    RESULT_CACHE_SIZE = 256  # 교정 결과 캐시 최대 항목 수
+
+    # 업로드 파일 재사용 기준 (Files API는 업로드 약 48시간 후 서버에서 파일을 삭제)
+    UPLOAD_CACHE_TTL = 47 * 60 * 60  # 초
+    UPLOAD_CACHE_SIZE = 256  # 최대 항목 수
+
+    # 업로드된 원본 파일 캐시 (API 키, 경로, 수정 시각, 크기) → (업로드 시각, 업로드 파일) (인스턴스 간 공유)
+    _upload_cache: "OrderedDict[tuple, Tuple[float, Any]]" = OrderedDict()
+    _upload_lock = threading.Lock()
+
+    # 교정 결과 캐시 sha256(HTML + 원본 경로) → 교정된 HTML (동일 입력 재실행 시 API 호출 생략)
+    _result_cache: "OrderedDict[str, str]" = OrderedDict()
+    _result_lock = threading.Lock()
 
     def __init__(self, api_key: str):
         """
@@ -190,6 +312,25 @@ class GeminiCorrector:
         self.api_key = api_key
         self.client = genai.Client(api_key=api_key)
 
+        # 비동기 요청 전용 이벤트 루프 (첫 호출 시 생성)
+        self._loop = None
+        self._loop_lock = threading.Lock()
+
+    def _run(self, coro):
+        """
+        교정기 전용 이벤트 루프에서 코루틴 실행 후 결과 반환
+
+        비동기 클라이언트의 연결은 생성된 이벤트 루프에 묶이므로, 호출마다 새 루프를 만들지 않고
+        하나의 루프를 계속 사용해 여러 스레드/호출 간에 연결(keep-alive)을 재사용합니다.
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever, name="gemini-correction-loop", daemon=True
+                ).start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
     def correct_html(self, html_content: str, original_file_path: str) -> str:
         """
         변환된 HTML을 Gemini 3.0 Flash로 교정
@@ -198,12 +339,50 @@ class GeminiCorrector:
             html_content: 변환된 HTML 문자열
             original_file_path: 원본 파일 경로
 
+        Returns:
+            교정된 HTML 문자열 (오류 시 원본 반환)
+        """
+        return self._run(self.correct_html_async(html_content, original_file_path))
+
+    async def correct_html_async(self, html_content: str, original_file_path: str,
+                                 semaphore: Optional[asyncio.Semaphore] = None) -> str:
+        """
+        correct_html의 비동기 버전
+
+        Args:
+            html_content: 변환된 HTML 문자열
+            original_file_path: 원본 파일 경로
+            semaphore: API 동시 요청 제한 (None이면 문서별로 MAX_CONCURRENCY 사용)
+
         Returns:
             교정된 HTML 문자열 (오류 시 원본 반환)
         """
         filename = os.path.basename(original_file_path)
         ext = os.path.splitext(original_file_path)[1].lower()
 
+        # 보이는 텍스트가 매우 짧으면 오류 가능성이 낮으므로 API 호출 생략
+        visible_text = _TAG_RE.sub('', html_content)
+        if len(visible_text.strip()) < self.MIN_CORRECT_CHARS:
+            _emit_log(f"[Gemini 교정] {filename} - 텍스트가 짧아 교정 생략")
+            return html_content
+
+        # 오류 의심 패턴이 하나도 없으면 교정 생략
+        if not _SUSPECT_RE.search(visible_text):
+            _emit_log(f"[Gemini 교정] {filename} - 오류 의심 구간 없음, 교정 생략")
+            return html_content
+
+        # 동일한 입력은 이전 교정 결과 재사용
+        cache_key = hashlib.sha256(
+            (html_content + '\0' + original_file_path).encode('utf-8')
+        ).hexdigest()
+        with self._result_lock:
+            cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            _emit_log(f"[Gemini 교정] {filename} - 이전 교정 결과 재사용")
+            return cached
+
+        semaphore = semaphore or asyncio.Semaphore(self.MAX_CONCURRENCY)
+
         # 원본 대조 가능 여부 판단
         has_original = ext in ORIGINAL_COMPARABLE_EXTENSIONS
 
@@ -213,21 +392,28 @@ class GeminiCorrector:
             _emit_log(f"[Gemini 교정] {filename} - 텍스트 교정 시작 (Gemini 3.0 Flash)")
 
         try:
-            # 원본 파일 준비 (대조 가능한 경우만)
+            # 원본 파일 준비 (대조 가능한 경우만, 업로드는 블로킹 호출이므로 스레드에서 실행)
             file_part = None
             if has_original:
-                file_part = self._prepare_file(original_file_path)
+                file_part = await asyncio.to_thread(self._prepare_file, original_file_path)
                 if file_part is None:
                     _emit_log(f"[Gemini 교정] {filename} - 원본 파일 준비 실패, 텍스트 전용 교정으로 전환", "warning")
 
             # HTML이 너무 긴 경우 청크로 분할
-            if len(html_content) > self.CHUNK_SIZE:
-                corrected = self._correct_chunked(html_content, file_part, filename)
+            measure, limit = self._chunk_measure()
+            if measure(html_content) > limit:
+                corrected = await self._correct_chunked(html_content, file_part, filename, semaphore)
             else:
-                corrected = self._call_gemini(html_content, file_part, filename)
+                async with semaphore:
+                    system_instruction, contents = self._build_contents(html_content, file_part)
+                    corrected = await self._call_gemini(system_instruction, contents, filename)
 
             if corrected and corrected.strip():
                 _emit_log(f"[Gemini 교정] {filename} - 교정 완료")
+                with self._result_lock:
+                    self._result_cache[cache_key] = corrected
+                    if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                        self._result_cache.popitem(last=False)
                 return corrected
             else:
                 _emit_log(f"[Gemini 교정] {filename} - 교정 결과 비어있음, 원본 유지", "warning")
@@ -243,29 +429,34 @@ class GeminiCorrector:
         원본 파일을 Gemini API에 전달할 수 있는 형태로 준비
 
         PDF → 파일 업로드
-        이미지 → 인라인 바이트
+        이미지 → 인라인 바이트 (INLINE_IMAGE_LIMIT 초과 시 파일 업로드)
         """
         ext = os.path.splitext(file_path)[1].lower()
 
         try:
+            # API가 받을 수 없는 크기는 업로드 전에 바로 포기 (업로드 시간 낭비 방지)
+            file_size = os.path.getsize(file_path)
+            if file_size > self.MAX_UPLOAD_SIZE:
+                _emit_log(
+                    f"[Gemini 교정] 원본 파일이 너무 큼 ({file_size // (1024 * 1024)}MB), 원본 대조 생략",
+                    "warning"
+                )
+                return None
+
             if ext == '.pdf':
                 # PDF는 파일 업로드 사용
                 _emit_log(f"[Gemini 교정] 원본 PDF 업로드 중...")
-                uploaded_file = self.client.files.upload(
-                    file=file_path,
-                    config=types.UploadFileConfig(
-                        mime_type="application/pdf"
-                    )
-                )
-                # 업로드 완료 대기
-                while uploaded_file.state == "PROCESSING":
-                    time.sleep(1)
-                    uploaded_file = self.client.files.get(name=uploaded_file.name)
-                return uploaded_file
+                return self._upload_file(file_path, "application/pdf")
+
+            elif ext in _IMAGE_EXTENSIONS:
+                mime_type = _guess_mime_type(ext)
+
+                # 대용량 이미지는 메모리에 읽지 않고 경로에서 바로 업로드
+                if file_size > self.INLINE_IMAGE_LIMIT:
+                    _emit_log(f"[Gemini 교정] 대용량 원본 이미지 업로드 중...")
+                    return self._upload_file(file_path, mime_type)
 
-            elif ext in ('.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif', '.gif', '.webp'):
                 # 이미지는 인라인 바이트로 전달
-                mime_type = mimetypes.guess_type(file_path)[0] or "image/png"
                 with open(file_path, 'rb') as f:
                     image_data = f.read()
                 return types.Part.from_bytes(data=image_data, mime_type=mime_type)
@@ -277,50 +468,86 @@ class GeminiCorrector:
             _emit_log(f"[Gemini 교정] 파일 준비 실패: {str(e)}", "warning")
             return None
 
-    def _call_gemini(self, html_content: str, file_part: Optional[Any], filename: str) -> Optional[str]:
+    def _upload_file(self, file_path: str, mime_type: str) -> Any:
+        """Gemini Files API로 업로드 후 처리 완료까지 대기 (같은 파일은 재사용)"""
+        # 같은 파일(경로, 수정 시각, 크기)은 서버에서 삭제되기 전까지 이전 업로드 결과 재사용
+        st = os.stat(file_path)
+        cache_key = (self.api_key, os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+        with self._upload_lock:
+            cached = self._upload_cache.get(cache_key)
+            if cached is not None:
+                uploaded_at, uploaded_file = cached
+                if time.monotonic() - uploaded_at < self.UPLOAD_CACHE_TTL:
+                    self._upload_cache.move_to_end(cache_key)
+                    return uploaded_file
+                del self._upload_cache[cache_key]  # 만료 - 다시 업로드
+
+        uploaded_at = time.monotonic()
+        uploaded_file = self.client.files.upload(
+            file=file_path,
+            config=types.UploadFileConfig(
+                mime_type=mime_type
+            )
+        )
+        # 업로드 완료 대기 (짧게 시작해 점점 늘리는 간격으로 상태 확인)
+        delay = self.UPLOAD_POLL_MIN
+        while uploaded_file.state == "PROCESSING":
+            time.sleep(delay)
+            delay = min(delay * 2, self.UPLOAD_POLL_MAX)
+            uploaded_file = self.client.files.get(name=uploaded_file.name)
+
+        with self._upload_lock:
+            # 업로드 요청 시각 기준으로 만료 (처리 대기 시간만큼 일찍 만료되는 쪽이 안전)
+            self._upload_cache[cache_key] = (uploaded_at, uploaded_file)
+            self._upload_cache.move_to_end(cache_key)
+            if len(self._upload_cache) > self.UPLOAD_CACHE_SIZE:
+                self._upload_cache.popitem(last=False)
+        return uploaded_file
+
+    def _build_contents(self, html_content: str, file_part: Optional[Any]) -> Tuple[str, list]:
         """
-        Gemini API 호출하여 HTML 교정
+        단일 교정 요청의 시스템 지시문과 contents 구성
+
+        고정된 교정 프롬프트는 system_instruction으로 분리하고 HTML은 별도 파트로 전달합니다.
+        (프롬프트+HTML 결합 문자열을 만들지 않고, 매 요청 동일한 접두부를 유지)
 
         Args:
             html_content: 교정할 HTML
             file_part: 원본 파일 (None이면 텍스트 전용 교정)
-            filename: 파일명 (로그용)
 
         Returns:
-            교정된 HTML 또는 None
+            (system_instruction, contents)
         """
         # 원본 대조 가능 여부에 따라 프롬프트 선택
-        if file_part is not None:
-            system_prompt = CORRECTION_WITH_ORIGINAL_PROMPT
-            suffix = "위 HTML을 원본 문서와 비교하여 교정된 HTML을 출력하세요.\n절대로 하나도 빠트리지 말고 전체를 정밀하게 검토하세요.\nHTML 구조와 태그를 절대 변경하지 말고, 텍스트 오류만 수정하세요."
-        else:
-            system_prompt = CORRECTION_TEXT_ONLY_PROMPT
-            suffix = "위 HTML의 텍스트를 정밀하게 교정하여 교정된 HTML을 출력하세요.\n절대로 하나도 빠트리지 말고 전체를 정밀하게 검토하세요.\nHTML 구조와 태그를 절대 변경하지 말고, 텍스트 오류만 수정하세요."
-
-        prompt_text = f"""{system_prompt}
-
----
-
-## 변환된 HTML (교정 대상)
-
-{html_content}
-
----
-
-{suffix}"""
+        system_prompt, suffix, _ = PROMPT_SETS[file_part is not None]
 
         # contents 구성
+        contents = ["## 변환된 HTML (교정 대상)", html_content, suffix]
         if file_part is not None:
-            contents = [file_part, prompt_text]
-        else:
-            contents = [prompt_text]
+            contents.insert(0, file_part)
+        return system_prompt, contents
+
+    async def _call_gemini(self, system_instruction: str, contents: list, filename: str) -> Optional[str]:
+        """
+        Gemini API 비동기 호출하여 HTML 교정
+
+        Args:
+            system_instruction: 교정 지시 프롬프트
+            contents: 요청 contents (원본 파일, HTML 등 파트 목록)
+            filename: 파일명 (로그용)
 
+        Returns:
+            교정된 HTML 또는 None
+        """
         for attempt in range(self.MAX_RETRIES):
+            # 토큰이 부족할 때만 대기 (블로킹 대기이므로 스레드에서 실행)
+            await asyncio.to_thread(_bucket.acquire)
             try:
-                response = self.client.models.generate_content(
+                response = await self.client.aio.models.generate_content(
                     model=self.MODEL_NAME,
                     contents=contents,
                     config=types.GenerateContentConfig(
+                        system_instruction=system_instruction,
                         temperature=0.1,  # 정확성 최우선
                         top_p=0.95,
                         max_output_tokens=65536  # 충분한 출력 길이
@@ -328,37 +555,43 @@ class GeminiCorrector:
                 )
 
                 if response and response.text:
-                    result = response.text.strip()
                     # 마크다운 코드 블록 제거
-                    result = re.sub(r'^```html\s*\n?', '', result)
-                    result = re.sub(r'^```\s*\n?', '', result)
-                    result = re.sub(r'\n?```\s*$', '', result)
-                    return result.strip()
+                    return _strip_code_fence(response.text)
 
                 _emit_log(f"[Gemini 교정] {filename} - 빈 응답 (시도 {attempt + 1}/{self.MAX_RETRIES})", "warning")
 
             except Exception as e:
                 error_msg = str(e)
                 if "429" in error_msg or "RESOURCE_EXHAUSTED" in error_msg:
-                    wait_time = self.RETRY_DELAY * (attempt + 1) * 2
-                    _emit_log(f"[Gemini 교정] Rate limit, {wait_time}초 대기 후 재시도...", "warning")
-                    time.sleep(wait_time)
+                    # 공유 버킷을 감속시켜 모든 요청의 간격을 함께 늘림
+                    _bucket.penalize(slow_for=RATE_LIMIT_SLOWDOWN)
+                    if attempt < self.MAX_RETRIES - 1:
+                        # 서버가 지정한 대기 시간이 있으면 따르고, 없으면 지수 백오프
+                        delay = _server_retry_delay(e) or self.RETRY_DELAY * (2 ** attempt)
+                        _emit_log(f"[Gemini 교정] Rate limit, {delay:g}초 후 재시도 {attempt + 1}/{self.MAX_RETRIES}", "warning")
+                        await asyncio.sleep(delay)
+                    else:
+                        _emit_log(f"[Gemini 교정] 최종 실패 (Rate limit): {error_msg}", "error")
                 elif attempt < self.MAX_RETRIES - 1:
                     _emit_log(f"[Gemini 교정] 오류 발생, 재시도 {attempt + 1}/{self.MAX_RETRIES}: {error_msg}", "warning")
-                    time.sleep(self.RETRY_DELAY)
+                    await asyncio.sleep(self.RETRY_DELAY)
                 else:
                     _emit_log(f"[Gemini 교정] 최종 실패: {error_msg}", "error")
 
         return None
 
-    def _correct_chunked(self, html_content: str, file_part: Optional[Any], filename: str) -> str:
+    async def _correct_chunked(self, html_content: str, file_part: Optional[Any], filename: str,
+                               semaphore: asyncio.Semaphore) -> str:
         """
         대용량 HTML을 청크로 분할하여 교정
 
+        청크 간 의존성이 없으므로 동시에 요청하고, 동시 요청 수는 semaphore로 제한합니다.
+
         Args:
             html_content: 전체 HTML
             file_part: 원본 파일 (None 가능)
             filename: 파일명
+            semaphore: API 동시 요청 제한
 
         Returns:
             교정된 전체 HTML
@@ -366,87 +599,99 @@ class GeminiCorrector:
         chunks = self._split_html(html_content)
         _emit_log(f"[Gemini 교정] {filename} - 대용량 문서, {len(chunks)}개 청크로 분할 교정")
 
-        # 원본 대조 가능 여부에 따라 청크 프롬프트 선택
-        if file_part is not None:
-            chunk_base_prompt = CORRECTION_CHUNK_WITH_ORIGINAL
-        else:
-            chunk_base_prompt = CORRECTION_CHUNK_TEXT_ONLY
-
-        corrected_parts = []
-
-        for i, chunk in enumerate(chunks):
-            _emit_log(f"[Gemini 교정] {filename} - 청크 {i + 1}/{len(chunks)} 교정 중...")
+        # 오류 의심 패턴이 있는 청크만 교정 (나머지는 그대로 유지하여 입력 토큰 절감)
+        suspect = [bool(_SUSPECT_RE.search(_TAG_RE.sub('', chunk))) for chunk in chunks]
+        clean_count = suspect.count(False)
+        if clean_count:
+            _emit_log(f"[Gemini 교정] {filename} - 오류 의심 구간 없는 청크 {clean_count}개 교정 생략")
 
-            chunk_prompt = f"""{chunk_base_prompt}
+        # 원본 대조 가능 여부에 따라 청크 프롬프트 선택
+        chunk_base_prompt = PROMPT_SETS[file_part is not None][2]
 
-## 변환된 HTML (청크 {i + 1}/{len(chunks)})
+        async def correct_chunk(index: int, chunk: str) -> str:
+            if not suspect[index]:
+                return chunk
 
-{chunk}
+            # contents 구성 (청크 프롬프트는 system_instruction으로 분리)
+            contents = [f"## 변환된 HTML (청크 {index + 1}/{len(chunks)})", chunk, "교정된 HTML만 출력하세요."]
+            if file_part is not None:
+                contents.insert(0, file_part)
 
----
+            async with semaphore:
+                _emit_log(f"[Gemini 교정] {filename} - 청크 {index + 1}/{len(chunks)} 교정 중...")
+                corrected_chunk = await self._call_gemini(chunk_base_prompt, contents, filename)
 
-교정된 HTML만 출력하세요."""
+            return corrected_chunk if corrected_chunk else chunk
 
-            # contents 구성
-            if file_part is not None:
-                contents = [file_part, chunk_prompt]
-            else:
-                contents = [chunk_prompt]
-
-            corrected_chunk = None
-            for attempt in range(self.MAX_RETRIES):
-                try:
-                    response = self.client.models.generate_content(
-                        model=self.MODEL_NAME,
-                        contents=contents,
-                        config=types.GenerateContentConfig(
-                            temperature=0.1,
-                            top_p=0.95,
-                            max_output_tokens=65536
-                        )
-                    )
+        # 결과는 입력 순서 유지
+        corrected_parts = await asyncio.gather(*(
+            correct_chunk(i, chunk) for i, chunk in enumerate(chunks)
+        ))
+        return '\n'.join(corrected_parts)
 
-                    if response and response.text:
-                        result = response.text.strip()
-                        result = re.sub(r'^```html\s*\n?', '', result)
-                        result = re.sub(r'^```\s*\n?', '', result)
-                        result = re.sub(r'\n?```\s*$', '', result)
-                        corrected_chunk = result.strip()
-                        break
+    def _chunk_measure(self) -> Tuple[Callable[[str], int], int]:
+        """청크 크기 측정 함수와 한도 (토크나이저가 있으면 토큰 수, 없으면 문자 수)"""
+        encoding = _get_token_encoding()
+        if encoding is None:
+            return len, self.CHUNK_SIZE
+        return (lambda text: len(encoding.encode_ordinary(text))), self.CHUNK_TOKENS
 
-                except Exception as e:
-                    if "429" in str(e) or "RESOURCE_EXHAUSTED" in str(e):
-                        time.sleep(self.RETRY_DELAY * (attempt + 1) * 2)
-                    elif attempt < self.MAX_RETRIES - 1:
-                        time.sleep(self.RETRY_DELAY)
+    def _split_html(self, content: str) -> list:
+        """
+        HTML을 논리적 청크로 분할
 
-            corrected_parts.append(corrected_chunk if corrected_chunk else chunk)
+        블록 태그 중첩 깊이를 추적하여 최상위 블록 경계(깊이 0)에서만 자르고,
+        최상위 경계가 없으면 표 바깥의 블록 경계에서 자릅니다 (표 중간은 자르지 않음).
+        청크는 경계 위치로 잘라내므로 문자열 누적 연결이 없습니다.
+        청크 크기는 로컬 토크나이저가 있으면 토큰 수, 없으면 문자 수로 측정합니다.
+        """
+        measure, limit = self._chunk_measure()
 
-            # 청크 간 대기 (Rate limit 방지)
-            if i < len(chunks) - 1:
-                time.sleep(1)
+        chunks = []
+        start = 0           # 현재 청크 시작 위치
+        start_size = 0      # 현재 청크 시작 위치까지의 누적 크기
+        size = 0            # 마지막 경계까지의 누적 크기 (경계 사이 구간별로 한 번씩 측정)
+        last_pos = 0
+        top_cut = (-1, 0)   # 현재 청크 안의 마지막 최상위(깊이 0) 경계 (위치, 누적 크기)
+        any_cut = (-1, 0)   # 현재 청크 안의 마지막 표 바깥 경계 (위치, 누적 크기)
+        depth = 0
+        table_depth = 0
+
+        for match in _BLOCK_TAG_RE.finditer(content):
+            closing, tag = match.group(1), match.group(2)
+            if tag:
+                tag = tag.lower()
+                if closing:
+                    depth = max(depth - 1, 0)
+                    if tag == 'table':
+                        table_depth = max(table_depth - 1, 0)
+                else:
+                    depth += 1
+                    if tag == 'table':
+                        table_depth += 1
+                    # 여는 태그 뒤는 분할 지점이 아님
+                    continue
 
-        return '\n'.join(corrected_parts)
+            if table_depth:
+                continue
 
-    def _split_html(self, content: str) -> list:
-        """HTML을 논리적 청크로 분할"""
-        chunks = []
-        current_chunk = ""
+            pos = match.end()
+            size += measure(content[last_pos:pos])
+            last_pos = pos
 
-        # 주요 분할 지점
-        split_pattern = re.compile(r'(</div>|</table>|<hr[^>]*>|</section>|</article>)')
-        parts = split_pattern.split(content)
+            if size - start_size > limit:
+                cut, cut_size = top_cut if top_cut[0] > start else any_cut
+                if cut > start:
+                    chunks.append(content[start:cut])
+                    start, start_size = cut, cut_size
+                top_cut = any_cut = (-1, 0)
 
-        for part in parts:
-            if len(current_chunk) + len(part) > self.CHUNK_SIZE:
-                if current_chunk:
-                    chunks.append(current_chunk)
-                current_chunk = part
-            else:
-                current_chunk += part
+            any_cut = (pos, size)
+            if depth == 0:
+                top_cut = (pos, size)
 
-        if current_chunk:
-            chunks.append(current_chunk)
+        if start < len(content):
+            chunks.append(content[start:])
 
         return chunks if chunks else [content]
 
@@ -478,6 +723,40 @@ def get_gemini_api_key() -> Optional[str]:
     return None
 
 
+@functools.lru_cache(maxsize=4)
+def _get_corrector(api_key: str) -> GeminiCorrector:
+    """
+    API 키별 교정기 재사용
+
+    genai.Client와 HTTP 연결 풀을 문서마다 새로 만들지 않고 같은 키의 호출 간에 공유합니다.
+    """
+    return GeminiCorrector(api_key=api_key)
+
+
+def _resolve_corrector(api_key: Optional[str]) -> Optional[GeminiCorrector]:
+    """
+    교정 가능 여부(SDK, API 키) 확인 후 교정기 반환
+
+    Returns:
+        GeminiCorrector (교정할 수 없으면 사유를 로그로 남기고 None)
+    """
+    if not HAS_GENAI:
+        _emit_log("[Gemini 교정] google-genai 패키지 미설치, 교정 건너뜀", "warning")
+        return None
+
+    # API 키 확인
+    key = api_key or get_gemini_api_key()
+    if not key:
+        _emit_log("[Gemini 교정] Gemini API 키 미설정, 교정 건너뜀", "warning")
+        return None
+
+    try:
+        return _get_corrector(key)
+    except Exception as e:
+        _emit_log(f"[Gemini 교정] 초기화 실패: {str(e)}", "warning")
+        return None
+
+
 def correct_html_with_gemini(html_content: str, original_file_path: str,
                               api_key: Optional[str] = None) -> str:
     """
@@ -495,19 +774,38 @@ def correct_html_with_gemini(html_content: str, original_file_path: str,
     Returns:
         교정된 HTML (실패 시 원본 반환)
     """
-    if not HAS_GENAI:
-        _emit_log("[Gemini 교정] google-genai 패키지 미설치, 교정 건너뜀", "warning")
+    corrector = _resolve_corrector(api_key)
+    if corrector is None:
         return html_content
 
-    # API 키 확인
-    key = api_key or get_gemini_api_key()
-    if not key:
-        _emit_log("[Gemini 교정] Gemini API 키 미설정, 교정 건너뜀", "warning")
-        return html_content
+    return corrector.correct_html(html_content, original_file_path)
 
-    try:
-        corrector = GeminiCorrector(api_key=key)
-        return corrector.correct_html(html_content, original_file_path)
-    except Exception as e:
-        _emit_log(f"[Gemini 교정] 초기화 실패: {str(e)}", "warning")
-        return html_content
+
+def correct_html_batch(items: List[Tuple[str, str]], api_key: Optional[str] = None,
+                       max_concurrency: int = 8) -> List[str]:
+    """
+    여러 문서를 동시에 Gemini 3.0 Flash로 교정
+
+    문서 간 의존성이 없으므로 하나의 교정기로 요청을 동시에 보내고,
+    문서/청크 요청 전체의 동시 실행 수를 max_concurrency로 제한합니다.
+
+    Args:
+        items: [(변환된 HTML, 원본 파일 경로), ...]
+        api_key: Gemini API 키 (None이면 자동 감지)
+        max_concurrency: 최대 동시 API 요청 수
+
+    Returns:
+        items 순서와 같은 교정된 HTML 목록 (실패한 문서는 원본 유지)
+    """
+    corrector = _resolve_corrector(api_key)
+    if corrector is None:
+        return [html_content for html_content, _ in items]
+
+    async def run_all() -> List[str]:
+        semaphore = asyncio.Semaphore(max_concurrency)
+        return await asyncio.gather(*(
+            corrector.correct_html_async(html_content, original_file_path, semaphore)
+            for html_content, original_file_path in items
+        ))
+
+    return corrector._run(run_all())
@@ -15,15 +15,28 @@ import sys
 import json
 import time
 import traceback
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict, Any
+import queue
+import multiprocessing
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Tuple, Optional
 from processor import FileProcessor
 
+# 빠른 JSON 직렬화 (선택)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # 병렬 처리 설정
 # - 로컬 변환 (DOCX, HWPX 등): CPU 코어 수 기반
 # - API 변환 (이미지 PDF): Upstage 권장사항 - 동시 요청 금지, 순차 처리만
 MAX_WORKERS_LOCAL = min(8, (os.cpu_count() or 4))
 MAX_WORKERS_API = 1  # Upstage: "send images one at a time in series" (동시 요청 시 429 에러)
+# - API 변환 결과 저장 (Clean HTML/Markdown 생성): 다음 파일 업로드와 겹쳐서 처리
+MAX_WORKERS_OUTPUT = 2
+# - 로컬 문서 파싱 (CPU 작업): 작업 프로세스에서 처리 (프로세스 시작 비용 때문에 파일이 여러 개일 때만)
+MIN_FILES_FOR_CONVERT_POOL = 2
 
 # 지원 파일 확장자
 SUPPORTED_EXTENSIONS = (
@@ -37,29 +50,122 @@ SUPPORTED_EXTENSIONS = (
     '.tiff', '.tif',
     '.gif', '.webp'
 )
+_EXT_SET = frozenset(ext.lower() for ext in SUPPORTED_EXTENSIONS)
+
+# Upstage API 대상 확장자 (이미지 PDF/이미지 파일)
+API_EXTENSIONS = frozenset({'.pdf', '.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif', '.gif', '.webp'})
 
 
 def emit_message(msg_type: str, **kwargs):
     """Electron으로 JSON 메시지 전송"""
     message = {"type": msg_type, **kwargs}
+
+    # orjson: UTF-8 바이트를 바로 만들어 한 번의 write로 기록 (텍스트 인코딩 단계 생략)
+    stream = getattr(sys.stdout, 'buffer', None)
+    if HAS_ORJSON and stream is not None:
+        stream.write(orjson.dumps(message, default=str) + b'\n')
+        stream.flush()  # 진행 상황은 즉시 UI에 반영되어야 하므로 메시지마다 flush
+        return
+
     print(json.dumps(message, ensure_ascii=False), flush=True)
 
 
-def collect_files(input_folder: str) -> List[str]:
-    """변환 대상 파일 수집"""
-    tasks = []
-    for root, dirs, files in os.walk(input_folder):
-        # 출력 폴더 제외
-        excluded = ('Converted_HTML', 'Final_Reviewed', 'Final_Reviewed_Gemini', 'Final_Reviewed_OpenAI', 'Archive')
-        dirs[:] = [d for d in dirs if d not in excluded]
+# 진행 상황 묶음 전송 기준
+PROGRESS_BATCH_SIZE = 16
+PROGRESS_FLUSH_INTERVAL = 0.05  # 초
 
-        for file in files:
-            if file.lower().endswith(SUPPORTED_EXTENSIONS):
-                # 숨김 파일 제외
-                if not file.startswith('.'):
-                    tasks.append(os.path.join(root, file))
+# 수집에서 제외할 출력 폴더
+EXCLUDED_DIRS = frozenset({
+    'Converted_HTML', 'Final_Reviewed', 'Final_Reviewed_Gemini', 'Final_Reviewed_OpenAI', 'Archive'
+})
 
-    return tasks
+
+class ProgressBatcher:
+    """
+    진행 상황 메시지 묶음 전송
+
+    완료가 몰릴 때 파일마다 한 줄씩 쓰지 않고 PROGRESS_BATCH_SIZE개 또는
+    PROGRESS_FLUSH_INTERVAL초 단위로 모아 "progress_batch" 한 줄로 전송합니다.
+    모인 항목이 하나뿐이면 기존과 같은 "progress" 메시지로 보냅니다.
+    """
+
+    def __init__(self, max_items: int = None, interval: float = None):
+        self.max_items = max_items or PROGRESS_BATCH_SIZE
+        self.interval = interval if interval is not None else PROGRESS_FLUSH_INTERVAL
+        self.items = []
+        self.started_at = 0.0
+
+    def add(self, item: Dict[str, Any]):
+        """항목 추가 (개수/시간 기준 도달 시 전송)"""
+        if not self.items:
+            self.started_at = time.monotonic()
+        self.items.append(item)
+
+        if len(self.items) >= self.max_items or time.monotonic() - self.started_at >= self.interval:
+            self.flush()
+
+    def timeout(self) -> Optional[float]:
+        """대기 중인 항목을 전송해야 할 때까지 남은 시간 (없으면 None)"""
+        if not self.items:
+            return None
+        return max(0.0, self.started_at + self.interval - time.monotonic())
+
+    def flush(self):
+        """모인 항목 전송"""
+        if not self.items:
+            return
+        if len(self.items) == 1:
+            emit_message("progress", **self.items[0])
+        else:
+            emit_message("progress_batch", items=self.items)
+        self.items = []
+
+
+def _walk_files(folder: str) -> Iterator[os.DirEntry]:
+    """
+    하위 폴더까지 파일 항목 순회 (os.scandir 재귀)
+
+    DirEntry의 캐시된 타입 정보를 사용하므로 파일별 추가 stat 호출이 없습니다.
+    os.walk와 같이 읽을 수 없는 폴더는 건너뛰고, 심볼릭 링크 폴더는 따라가지 않습니다.
+    """
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if entry.name not in EXCLUDED_DIRS and not entry.is_symlink():
+                        yield from _walk_files(entry.path)
+                else:
+                    yield entry
+    except OSError:
+        return
+
+
+def collect_files(input_folder: str) -> Tuple[List[str], List[str]]:
+    """
+    변환 대상 파일 수집
+
+    Returns:
+        (로컬 변환 대상, API 변환 대상) - 수집과 동시에 분류
+    """
+    local_files = []
+    api_files = []
+    for entry in _walk_files(input_folder):
+        name = entry.name
+        # 숨김 파일 제외
+        if name.startswith('.'):
+            continue
+
+        # 확장자만 잘라 집합 조회 (파일명 전체를 소문자로 복사하지 않음)
+        idx = name.rfind('.')
+        if idx <= 0:
+            continue
+        ext = name[idx:].lower()
+        if ext in API_EXTENSIONS:
+            api_files.append(entry.path)
+        elif ext in _EXT_SET:
+            local_files.append(entry.path)
+
+    return local_files, api_files
 
 
 def main():
@@ -73,6 +179,8 @@ def main():
         [4] generate_markdown: 마크다운 생성 여부 (true/false, 기본: true)
         [5] gemini_api_key: Gemini API 키 (Upstage 변환 후 자동 교정용, 선택)
         [6] enable_gemini_correction: Gemini 교정 활성화 여부 (true/false, 기본: true)
+        [7] preserve_excel_styles: Excel 셀 서식 보존 여부 (true/false, 기본: true)
+            (false면 서식 없이 값만 빠르게 변환)
     """
     try:
         # 인자 파싱
@@ -91,6 +199,9 @@ def main():
         gemini_api_key = sys.argv[5] if len(sys.argv) > 5 else os.environ.get('GEMINI_API_KEY', '')
         enable_gemini_correction = sys.argv[6].lower() != 'false' if len(sys.argv) > 6 else True
 
+        # Excel 서식 옵션
+        preserve_excel_styles = sys.argv[7].lower() != 'false' if len(sys.argv) > 7 else True
+
         # 입력 폴더 검증
         if not os.path.isdir(input_folder):
             emit_message("error", msg=f"폴더를 찾을 수 없습니다: {input_folder}")
@@ -107,7 +218,8 @@ def main():
             generate_clean_html=generate_clean,
             generate_markdown=generate_markdown,
             gemini_api_key=gemini_api_key,
-            enable_gemini_correction=enable_gemini_correction
+            enable_gemini_correction=enable_gemini_correction,
+            preserve_excel_styles=preserve_excel_styles
         )
 
         # Gemini 교정 상태 로그
@@ -119,21 +231,33 @@ def main():
             elif not enable_gemini_correction:
                 emit_message("log", msg="Gemini 3.0 Flash 자동 교정: 비활성화 (사용자 설정)")
 
-        # 파일 수집
-        tasks = collect_files(input_folder)
+        # 파일 수집 (API 대상 / 로컬 변환 대상 분류 포함)
+        # - API 대상: Upstage 제한에 따라 전용 워커 1개로 순차 처리
+        # - 로컬 대상: API 순차 처리와 별개로 병렬 처리 (API 파일이 있어도 직렬화하지 않음)
+        local_tasks, api_tasks = collect_files(input_folder)
+        total = len(local_tasks) + len(api_tasks)
 
-        if not tasks:
+        if not total:
             emit_message("warning", msg="변환할 파일이 없습니다")
             return 0
 
-        # 워커 수 결정 (이미지 PDF/이미지 파일이 있으면 API 제한 적용)
-        api_extensions = ('.pdf', '.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif', '.gif', '.webp')
-        has_api_files = any(f.lower().endswith(api_extensions) for f in tasks)
-        workers = MAX_WORKERS_API if has_api_files else MAX_WORKERS_LOCAL
+        local_workers = min(MAX_WORKERS_LOCAL, len(local_tasks))
+        api_workers = MAX_WORKERS_API if api_tasks else 0
+        workers = local_workers + api_workers
+
+        # 로컬 변환은 작업 프로세스에서 파싱 (GIL 없이 여러 코어 사용)
+        # 크레딧 차감/Gemini 교정/저장은 로컬 작업 스레드가 결과를 받아 이 프로세스에서 처리
+        convert_pool = None
+        if len(local_tasks) >= MIN_FILES_FOR_CONVERT_POOL:
+            convert_pool = FileProcessor.create_convert_pool(
+                max_workers=local_workers,
+                preserve_excel_styles=preserve_excel_styles
+            )
+            processor.convert_pool = convert_pool
 
         # 초기화 메시지
         emit_message("init",
-            total=len(tasks),
+            total=total,
             workers=workers,
             output_folder=output_folder
         )
@@ -149,19 +273,49 @@ def main():
         start_time = time.time()
 
         # 병렬 처리 실행
-        with ThreadPoolExecutor(max_workers=workers) as executor:
+        with ThreadPoolExecutor(max_workers=max(local_workers, 1), thread_name_prefix="convert-local") as local_executor, \
+                ThreadPoolExecutor(max_workers=MAX_WORKERS_API, thread_name_prefix="convert-api") as api_executor, \
+                ThreadPoolExecutor(max_workers=MAX_WORKERS_OUTPUT, thread_name_prefix="convert-output") as output_executor:
+            # 작업 완료 시 결과 큐에 넣음 (as_completed의 대기 목록 관리 없이 완료 순서대로 처리)
+            done_queue = queue.SimpleQueue()
+
             # 작업 제출
+            # - API 대상: 변환 후 출력 저장은 출력 워커에 넘기고 Future를 반환 (다음 업로드를 바로 시작)
             future_to_file = {
-                executor.submit(processor.process, filepath): filepath
-                for filepath in tasks
+                api_executor.submit(processor.process_deferred, filepath, output_executor): filepath
+                for filepath in api_tasks
             }
+            future_to_file.update({
+                local_executor.submit(processor.process, filepath): filepath
+                for filepath in local_tasks
+            })
+
+            for future in future_to_file:
+                future.add_done_callback(done_queue.put)
+
+            # 결과 수집 (진행 상황은 짧은 간격으로 묶어서 전송)
+            progress = ProgressBatcher()
+            remaining = len(future_to_file)
+            while remaining:
+                while True:
+                    try:
+                        future = done_queue.get(timeout=progress.timeout())
+                        break
+                    except queue.Empty:
+                        # 묶음 대기 시간이 지나면 다음 완료를 기다리지 않고 전송
+                        progress.flush()
 
-            # 결과 수집
-            for future in as_completed(future_to_file):
                 filepath = future_to_file[future]
                 try:
                     result = future.result()
-                    emit_message("progress", **result)
+                    if isinstance(result, Future):
+                        # API 변환 완료, 출력 저장 중 → 저장이 끝나면 다시 결과 큐로
+                        future_to_file[result] = filepath
+                        result.add_done_callback(done_queue.put)
+                        continue
+
+                    remaining -= 1
+                    progress.add(result)
 
                     if result.get("status") == "success":
                         stats["success"] += 1
@@ -179,12 +333,19 @@ def main():
                         stats["fail"] += 1
 
                 except Exception as e:
+                    remaining -= 1
                     stats["fail"] += 1
-                    emit_message("progress",
-                        status="fail",
-                        file=os.path.basename(filepath),
-                        error=str(e)
-                    )
+                    progress.add({
+                        "status": "fail",
+                        "file": os.path.basename(filepath),
+                        "error": str(e)
+                    })
+
+            progress.flush()
+
+        if convert_pool:
+            convert_pool.shutdown()
+        processor.close()
 
         # 완료 메시지
         total_elapsed = round(time.time() - start_time, 2)
@@ -205,4 +366,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # PyInstaller 빌드에서 작업 프로세스가 main()을 다시 실행하지 않도록 함
+    multiprocessing.freeze_support()
     sys.exit(main())
@@ -8,17 +8,37 @@ Features:
 - 변환된 HTML 문서 목록 조회
 - 문서 내용 읽기
 - 검수 완료된 문서 저장
+- OCR 오류 자동 교정
 - OCR 오류 통계 분석
 """
 
 import os
 import sys
+import atexit
+import mmap
 import json
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 from pathlib import Path
 
+# 빠른 JSON 직렬화 (선택)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Aho-Corasick 다중 패턴 검색 (선택, pyahocorasick)
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
 # MCP 임포트
 try:
     from mcp.server.fastmcp import FastMCP
@@ -47,6 +67,16 @@ STATS_FILE = os.path.join(BASE_DIR, "review_stats.json")
 os.makedirs(INPUT_DIR, exist_ok=True)
 os.makedirs(REVIEW_DIR, exist_ok=True)
 
+# analyze_ocr_errors가 반환하는 최대 오류 개수
+MAX_REPORTED_ERRORS = 50
+
+# 이 크기(bytes)를 넘는 문서는 ANALYZE_CHUNK_SIZE 단위로 나눠 여러 프로세스에서 분석
+PARALLEL_ANALYZE_SIZE = 1_000_000
+ANALYZE_CHUNK_SIZE = 256 * 1024
+
+# 폴더 목록 캐시 유지 시간 (초) - 폴더 mtime이 같아도 이 시간이 지나면 다시 조회
+DIR_CACHE_TTL = 5.0
+
 # MCP 서버 초기화
 mcp = FastMCP(APP_NAME)
 
@@ -90,60 +120,135 @@ OCR_ERROR_PATTERNS = {
     "자": ["차", "사"],
 }
 
+# 패턴 문자열 intern - 모든 분석 결과/중복 검사 키가 같은 문자열 객체(캐시된 해시)를 공유
+OCR_ERROR_PATTERNS = {
+    sys.intern(correct): [sys.intern(wrong) for wrong in wrong_list]
+    for correct, wrong_list in OCR_ERROR_PATTERNS.items()
+}
+
+# 오인식 문자 -> 올바른 문자 (같은 오인식 문자가 여러 곳에 있으면 먼저 나온 항목 우선)
+_WRONGS: Dict[str, str] = {}
+for _correct, _wrong_list in OCR_ERROR_PATTERNS.items():
+    for _wrong in _wrong_list:
+        _WRONGS.setdefault(_wrong, _correct)
+
+# UTF-8 인코딩된 오인식 문자 -> (오인식 문자, 올바른 문자)
+_WRONGS_BYTES: Dict[bytes, tuple] = {
+    wrong.encode('utf-8'): (wrong, correct) for wrong, correct in _WRONGS.items()
+}
+
+# 한글 음절(U+AC00~U+D7A3)의 UTF-8 3바이트 범위 (느슨한 범위 - 매칭 후 정확히 확인)
+_HANGUL_UTF8 = rb'[\xea-\xed][\x80-\xbf][\x80-\xbf]'
+
+
+
+def _build_ocr_re(wrongs_bytes) -> re.Pattern:
+    """
+    오인식 패턴들을 하나의 bytes 정규식으로 결합 (긴 패턴 우선, 한 번의 스캔으로 검사)
+
+    파일을 디코딩하지 않고 UTF-8 bytes(mmap)에 바로 적용합니다.
+    HTML 태그는 첫 번째 대안으로 통째로 건너뜀 (그룹 2가 None) - 태그 제거용 사본 불필요
+    뒷 글자는 전방 탐색으로 확인하므로 소비되지 않아, 한 글자를 사이에 둔 연속 오류
+    (예: 가X나Y다)도 모두 검색됩니다.
+    """
+    return re.compile(
+        rb'<[^>]+>|(' + _HANGUL_UTF8 + rb')('
+        + b'|'.join(re.escape(w) for w in sorted(wrongs_bytes, key=len, reverse=True))
+        + rb')(?=(' + _HANGUL_UTF8 + rb'))'
+    )
+
+
+def _is_hangul_syllables(text: str) -> bool:
+    """문자열에 한글 음절이 있는지 확인"""
+    return any('가' <= ch <= '힣' for ch in text)
+
+
+def _is_cjk_ideographs(text: str) -> bool:
+    """문자열이 모두 한자(CJK 통합 한자)인지 확인"""
+    return all('\u4e00' <= ch <= '\u9fff' for ch in text)
+
+
+_OCR_RE = _build_ocr_re(_WRONGS_BYTES)
+
+# 자동 교정 대상: 영문이 섞인 여러 글자 오인식(7l, cl 등)과 한자 오인식(子, 于) → 한글 음절
+# - 한글→한글 패턴(사→자, 재→제 등)은 정상 단어(회사, 사재 등)를 훼손하므로 제외
+# - 한 글자 숫자/영문(1→이, 2→을, O, l 등)과 숫자만으로 된 패턴(71→가)은
+#   조문 번호(제1조, 제71조)와 겹치므로 제외 (analyze_ocr_errors로 확인 후 수동 검수)
+_AUTO_FIX_BYTES: Dict[bytes, tuple] = {
+    wrong_bytes: (wrong, correct)
+    for wrong_bytes, (wrong, correct) in _WRONGS_BYTES.items()
+    if _is_hangul_syllables(correct) and not _is_hangul_syllables(wrong)
+    and ((len(wrong) > 1 and not wrong.isdigit()) or _is_cjk_ideographs(wrong))
+}
+_AUTO_FIX_RE = _build_ocr_re(_AUTO_FIX_BYTES)
+
+# pyahocorasick이 있으면 오인식 문자 사전을 오토마톤으로 구성 (패턴 수와 무관한 단일 패스)
+_AC = None
+if HAS_AHOCORASICK:
+    _AC = ahocorasick.Automaton()
+    for _wrong, _correct in _WRONGS.items():
+        _AC.add_word(_wrong, (_wrong, _correct))
+    _AC.make_automaton()
+
 
 # ============================================================
 # 도구 함수
 # ============================================================
 @mcp.tool()
-def list_documents(status: str = "pending") -> str:
+def list_documents(status: str = "pending", offset: int = 0, limit: int = 500) -> str:
     """
     검수 대기 중인 HTML 문서 목록을 반환합니다.
 
     Args:
         status: "pending" (검수 대기), "reviewed" (검수 완료), "all" (전체)
+        offset: 건너뛸 문서 수 (파일명 순)
+        limit: 반환할 최대 문서 수
 
     Returns:
-        문서 목록 JSON
+        문서 목록 JSON (total: 전체 문서 수, count: 이번에 반환한 문서 수)
     """
     try:
-        result = {"pending": [], "reviewed": [], "total": 0}
-
-        # 변환된 문서 (검수 대기)
-        if os.path.exists(INPUT_DIR):
-            for f in os.listdir(INPUT_DIR):
-                if f.endswith('.html'):
-                    filepath = os.path.join(INPUT_DIR, f)
-                    stat = os.stat(filepath)
-                    result["pending"].append({
-                        "filename": f,
-                        "size": stat.st_size,
-                        "modified": datetime.fromtimestamp(stat.st_mtime).isoformat()
-                    })
-
-        # 검수 완료 문서
-        if os.path.exists(REVIEW_DIR):
-            for f in os.listdir(REVIEW_DIR):
-                if f.endswith('.html'):
-                    filepath = os.path.join(REVIEW_DIR, f)
-                    stat = os.stat(filepath)
-                    result["reviewed"].append({
-                        "filename": f,
-                        "size": stat.st_size,
-                        "modified": datetime.fromtimestamp(stat.st_mtime).isoformat()
-                    })
-
-        result["total"] = len(result["pending"]) + len(result["reviewed"])
-
-        # 상태별 필터링
-        if status == "pending":
-            return json.dumps({"documents": result["pending"], "count": len(result["pending"])}, ensure_ascii=False, indent=2)
-        elif status == "reviewed":
-            return json.dumps({"documents": result["reviewed"], "count": len(result["reviewed"])}, ensure_ascii=False, indent=2)
+        offset = max(offset, 0)
+        end = offset + max(limit, 0)
+
+        # 요청한 상태의 폴더만 조회 (폴더 mtime이 그대로면 캐시된 목록 객체가 반환됨)
+        if status == "pending" or status == "reviewed":
+            listings = (_scan_html(INPUT_DIR if status == "pending" else REVIEW_DIR),)
         else:
-            return json.dumps(result, ensure_ascii=False, indent=2)
+            listings = (_scan_html(INPUT_DIR), _scan_html(REVIEW_DIR))
+
+        # 목록이 직전 응답과 같은 객체면 직렬화된 JSON 재사용
+        key = (status, offset, end)
+        cached = _LIST_RESPONSE_CACHE.get(key)
+        if cached and all(prev is cur for prev, cur in zip(cached[0], listings)):
+            return cached[1]
+
+        if len(listings) == 1:
+            documents = listings[0]
+            page = documents[offset:end]
+            response = _dumps({
+                "documents": page,
+                "count": len(page),
+                "total": len(documents),
+                "has_more": end < len(documents)
+            })
+        else:
+            # 전체: 두 폴더 모두 조회
+            pending, reviewed = listings
+            response = _dumps({
+                "pending": pending[offset:end],
+                "reviewed": reviewed[offset:end],
+                "total": len(pending) + len(reviewed),
+                "has_more": end < max(len(pending), len(reviewed))
+            })
+
+        if len(_LIST_RESPONSE_CACHE) >= LIST_RESPONSE_CACHE_SIZE:
+            _LIST_RESPONSE_CACHE.clear()
+        _LIST_RESPONSE_CACHE[key] = (listings, response)
+        return response
 
     except Exception as e:
-        return json.dumps({"error": str(e)}, ensure_ascii=False)
+        return _dumps({"error": str(e)}, indent=False)
 
 
 @mcp.tool()
@@ -191,49 +296,28 @@ def analyze_ocr_errors(filename: str) -> str:
     try:
         filepath = os.path.join(INPUT_DIR, filename)
         if not os.path.exists(filepath):
-            return json.dumps({"error": "파일을 찾을 수 없습니다"}, ensure_ascii=False)
-
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # HTML 태그 제거하고 텍스트만 추출
-        text = re.sub(r'<[^>]+>', ' ', content)
-
-        potential_errors = []
-
-        # 패턴 매칭
-        for correct, wrong_list in OCR_ERROR_PATTERNS.items():
-            for wrong in wrong_list:
-                # 단어 경계 내 오류 패턴 찾기
-                pattern = re.compile(rf'([가-힣])({re.escape(wrong)})([가-힣])')
-                matches = pattern.findall(text)
-
-                for match in matches:
-                    context = ''.join(match)
-                    potential_errors.append({
-                        "found": wrong,
-                        "expected": correct,
-                        "context": context,
-                        "suggestion": match[0] + correct + match[2]
-                    })
-
-        # 중복 제거
-        unique_errors = []
-        seen = set()
-        for err in potential_errors:
-            key = (err["found"], err["context"])
-            if key not in seen:
-                seen.add(key)
-                unique_errors.append(err)
-
-        return json.dumps({
+            return _dumps({"error": "파일을 찾을 수 없습니다"}, indent=False)
+
+        # 전체를 str로 디코딩하지 않고 mmap 위에서 바로 검사
+        unique_errors, truncated = [], False
+        with open(filepath, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                mm = None  # 빈 파일은 mmap 불가
+            if mm is not None:
+                with mm:
+                    unique_errors, truncated = _find_ocr_errors(mm)
+
+        return _dumps({
             "filename": filename,
-            "potential_errors": unique_errors[:50],  # 최대 50개
-            "total_found": len(unique_errors)
-        }, ensure_ascii=False, indent=2)
+            "potential_errors": unique_errors,
+            "total_found": len(unique_errors),
+            "truncated": truncated  # True면 MAX_REPORTED_ERRORS개 이후 스캔 중단
+        })
 
     except Exception as e:
-        return json.dumps({"error": str(e)}, ensure_ascii=False)
+        return _dumps({"error": str(e)}, indent=False)
 
 
 @mcp.tool()
@@ -249,40 +333,75 @@ def save_reviewed_document(filename: str, content: str) -> str:
         저장 결과 메시지
     """
     try:
-        # 저장 경로
-        save_path = os.path.join(REVIEW_DIR, filename)
-
-        # 백업 (기존 파일이 있으면)
-        if os.path.exists(save_path):
-            backup_path = save_path + f".backup.{int(datetime.now().timestamp())}"
-            os.rename(save_path, backup_path)
-
-        # 저장
-        with open(save_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-
-        # 원본 파일 삭제 또는 이동
-        original_path = os.path.join(INPUT_DIR, filename)
-        if os.path.exists(original_path):
-            archive_dir = os.path.join(BASE_DIR, "Archive")
-            os.makedirs(archive_dir, exist_ok=True)
-            archive_path = os.path.join(archive_dir, filename)
-            os.rename(original_path, archive_path)
+        save_path = _store_reviewed(filename, content.encode('utf-8'))
 
         # 통계 업데이트
         _update_stats(filename, content)
 
-        return json.dumps({
+        return _dumps({
             "success": True,
             "saved_to": save_path,
             "message": f"검수 완료: {filename}"
-        }, ensure_ascii=False)
+        }, indent=False)
 
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": str(e)
-        }, ensure_ascii=False)
+        }, indent=False)
+
+
+@mcp.tool()
+def auto_correct_document(filename: str) -> str:
+    """
+    확실한 OCR 오류를 자동 수정하고 검수 완료 문서로 저장합니다.
+
+    한글 사이에 낀 영문이 섞인 여러 글자 오인식(7l, cl 등)과 한자 오인식(子, 于)만
+    한 번의 치환으로 수정합니다 (태그 내부는 유지).
+    숫자/한 글자 영문(제1조, 제71조 등)과 한글→한글 패턴(사→자 등)은 정상 표기일 수 있으므로
+    수정하지 않습니다. 이런 항목은 analyze_ocr_errors로 확인한 뒤 save_reviewed_document로 저장하세요.
+
+    Args:
+        filename: 수정할 파일명
+
+    Returns:
+        저장 결과 및 수정 건수
+    """
+    try:
+        filepath = os.path.join(INPUT_DIR, filename)
+        try:
+            with open(filepath, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return _dumps({"success": False, "error": "파일을 찾을 수 없습니다"}, indent=False)
+
+        corrections: Dict[str, int] = {}
+
+        def _fix(match):
+            before, wrong_bytes, after = match.groups()
+            if wrong_bytes is None or not (_is_hangul_utf8(before) and _is_hangul_utf8(after)):
+                return match.group(0)  # 태그 또는 한글 사이가 아님 - 그대로 유지
+            wrong, correct = _AUTO_FIX_BYTES[wrong_bytes]
+            key = f"{wrong}->{correct}"
+            corrections[key] = corrections.get(key, 0) + 1
+            return before + correct.encode('utf-8')  # 뒷 글자는 전방 탐색이라 매치에 포함되지 않음
+
+        save_path = _store_reviewed(filename, _AUTO_FIX_RE.sub(_fix, data))
+        _update_stats(filename, corrections=corrections)
+
+        return _dumps({
+            "success": True,
+            "saved_to": save_path,
+            "corrections": sum(corrections.values()),
+            "by_pattern": corrections,
+            "message": f"자동 교정 완료: {filename}"
+        }, indent=False)
+
+    except Exception as e:
+        return _dumps({
+            "success": False,
+            "error": str(e)
+        }, indent=False)
 
 
 @mcp.tool()
@@ -351,28 +470,21 @@ def get_review_stats() -> str:
         검수 통계 JSON
     """
     try:
-        if os.path.exists(STATS_FILE):
-            with open(STATS_FILE, 'r', encoding='utf-8') as f:
-                stats = json.load(f)
-        else:
-            stats = {
-                "total_reviewed": 0,
-                "total_corrections": 0,
-                "common_errors": {},
-                "last_updated": None
-            }
+        # 캐시된 통계를 복사해 현재 상태만 덧붙임 (파일에는 기록하지 않음)
+        stats = dict(_load_stats())
 
         # 현재 상태 추가
-        pending_count = len([f for f in os.listdir(INPUT_DIR) if f.endswith('.html')]) if os.path.exists(INPUT_DIR) else 0
-        reviewed_count = len([f for f in os.listdir(REVIEW_DIR) if f.endswith('.html')]) if os.path.exists(REVIEW_DIR) else 0
+        # list_documents와 같은 폴더 목록 캐시 사용
+        pending_count = len(_scan_html(INPUT_DIR))
+        reviewed_count = len(_scan_html(REVIEW_DIR))
 
         stats["current_pending"] = pending_count
         stats["current_reviewed"] = reviewed_count
 
-        return json.dumps(stats, ensure_ascii=False, indent=2)
+        return _dumps(stats)
 
     except Exception as e:
-        return json.dumps({"error": str(e)}, ensure_ascii=False)
+        return _dumps({"error": str(e)}, indent=False)
 
 
 @mcp.tool()
@@ -390,12 +502,15 @@ def set_working_directory(path: str) -> str:
 
     try:
         if not os.path.exists(path):
-            return json.dumps({"error": f"경로가 존재하지 않습니다: {path}"}, ensure_ascii=False)
+            return _dumps({"error": f"경로가 존재하지 않습니다: {path}"}, indent=False)
 
         # Converted_HTML 폴더 확인
         converted_dir = os.path.join(path, "Converted_HTML")
         if not os.path.exists(converted_dir):
-            return json.dumps({"error": f"Converted_HTML 폴더가 없습니다: {path}"}, ensure_ascii=False)
+            return _dumps({"error": f"Converted_HTML 폴더가 없습니다: {path}"}, indent=False)
+
+        # 이전 작업 디렉토리의 통계 기록
+        _reset_stats()
 
         # 경로 업데이트
         BASE_DIR = path
@@ -404,36 +519,363 @@ def set_working_directory(path: str) -> str:
         STATS_FILE = os.path.join(path, "review_stats.json")
 
         os.makedirs(REVIEW_DIR, exist_ok=True)
+        _invalidate_dir_cache()
 
-        return json.dumps({
+        return _dumps({
             "success": True,
             "base_dir": BASE_DIR,
             "input_dir": INPUT_DIR,
             "review_dir": REVIEW_DIR
-        }, ensure_ascii=False, indent=2)
+        })
 
     except Exception as e:
-        return json.dumps({"error": str(e)}, ensure_ascii=False)
+        return _dumps({"error": str(e)}, indent=False)
 
 
 # ============================================================
 # 내부 헬퍼 함수
 # ============================================================
-def _update_stats(filename: str, content: str):
-    """검수 통계 업데이트"""
+def _store_reviewed(filename: str, data: bytes) -> str:
+    """검수 완료 문서 저장 후 원본을 Archive로 이동 (저장 경로 반환)"""
+    save_path = os.path.join(REVIEW_DIR, filename)
+
+    # 저장 (임시 파일에 쓴 뒤 교체, 기존 파일은 백업)
+    _write_atomic(save_path, data, backup=True)
+
+    # 원본 파일 이동 (없으면 무시)
+    archive_dir = os.path.join(BASE_DIR, "Archive")
+    os.makedirs(archive_dir, exist_ok=True)
     try:
-        if os.path.exists(STATS_FILE):
-            with open(STATS_FILE, 'r', encoding='utf-8') as f:
-                stats = json.load(f)
-        else:
+        os.replace(os.path.join(INPUT_DIR, filename), os.path.join(archive_dir, filename))
+    except FileNotFoundError:
+        pass
+
+    # 두 폴더의 파일이 바뀌었으므로 목록 캐시 무효화
+    _invalidate_dir_cache(INPUT_DIR, REVIEW_DIR)
+    return save_path
+
+
+def _write_atomic(path: str, data: bytes, backup: bool = False):
+    """
+    파일 원자적 저장
+
+    임시 파일에 모두 쓴 뒤 os.replace로 교체하므로 쓰는 도중 중단되어도
+    기존 파일이 깨지지 않습니다. backup=True면 기존 파일을 .backup.<시각>으로 옮깁니다.
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+
+    if backup:
+        try:
+            os.replace(path, path + f".backup.{int(datetime.now().timestamp())}")
+        except FileNotFoundError:
+            pass  # 기존 파일 없음
+
+    os.replace(tmp_path, path)
+
+
+def _is_hangul_utf8(b: bytes) -> bool:
+    """UTF-8 3바이트 문자가 한글 음절(U+AC00~U+D7A3)인지 정수 연산으로 확인"""
+    cp = ((b[0] & 0x0F) << 12) | ((b[1] & 0x3F) << 6) | (b[2] & 0x3F)
+    return 0xAC00 <= cp <= 0xD7A3
+
+
+def _iter_matches_re(data) -> Iterator[tuple]:
+    """bytes 정규식으로 (앞 글자, 오인식 문자, 뒷 글자, 올바른 문자) 검색"""
+    for match in _OCR_RE.finditer(data):
+        before, wrong_bytes, after = match.groups()
+        if wrong_bytes is None:
+            continue
+        if not (_is_hangul_utf8(before) and _is_hangul_utf8(after)):
+            continue
+        wrong, correct = _WRONGS_BYTES[wrong_bytes]
+        yield before.decode('utf-8'), wrong, after.decode('utf-8'), correct
+
+
+def _iter_matches_ac(data) -> Iterator[tuple]:
+    """
+    Aho-Corasick 오토마톤으로 (앞 글자, 오인식 문자, 뒷 글자, 올바른 문자) 검색
+
+    pyahocorasick은 str만 받으므로 문서를 한 번 디코딩하고,
+    태그 사이의 텍스트 구간에서만 오토마톤을 실행합니다.
+    """
+    text = str(data, 'utf-8', 'replace')
+    length = len(text)
+    pos = 0
+
+    while pos < length:
+        # 다음 태그 직전까지가 텍스트 구간 (닫히지 않은 '<'는 텍스트로 취급)
+        tag_start = text.find('<', pos)
+        tag_end = text.find('>', tag_start + 1) if tag_start >= 0 else -1
+        segment_end = tag_start if tag_end >= 0 else length
+
+        for end_idx, (wrong, correct) in _AC.iter(text, pos, segment_end):
+            start = end_idx - len(wrong) + 1
+            if start <= pos or end_idx + 1 >= segment_end:
+                continue  # 앞뒤 글자가 구간 밖
+            before = text[start - 1]
+            after = text[end_idx + 1]
+            if '가' <= before <= '힣' and '가' <= after <= '힣':
+                yield before, wrong, after, correct
+
+        if tag_end < 0:
+            break
+        pos = tag_end + 1
+
+
+def _iter_matches(data) -> Iterator[tuple]:
+    """오토마톤(있으면) 또는 bytes 정규식으로 일치 항목 검색"""
+    if _AC is not None:
+        return _iter_matches_ac(data)
+    return _iter_matches_re(data)
+
+
+def _scan_chunk(chunk: bytes) -> List[tuple]:
+    """프로세스 풀 작업 함수 - 청크 내 중복을 제거한 일치 목록 (문서 순서 유지)"""
+    return list(dict.fromkeys(_iter_matches(chunk)))
+
+
+def _split_chunks(data, chunk_size: int) -> Iterator[tuple]:
+    """
+    태그 끝('>') 직후에서 문서를 (시작, 끝) 구간으로 분할
+
+    경계 앞 글자가 '>'이므로 한글 사이 패턴이 두 청크에 걸치지 않습니다.
+    """
+    length = len(data)
+    pos = 0
+    while pos < length:
+        end = data.find(b'>', pos + chunk_size)
+        end = length if end < 0 else end + 1
+        yield pos, end
+        pos = end
+
+
+_analyze_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_analyze_pool() -> ProcessPoolExecutor:
+    """대용량 문서 분석용 프로세스 풀 (첫 사용 시 생성 후 재사용)"""
+    global _analyze_pool
+    if _analyze_pool is None:
+        _analyze_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+    return _analyze_pool
+
+
+def _iter_matches_parallel(data) -> Iterator[tuple]:
+    """
+    대용량 문서를 청크로 나눠 프로세스 풀에서 병렬 검색
+
+    청크 순서대로 결과를 내보내므로 문서 순서가 유지되고, 호출 측이 일찍
+    멈추면 남은 작업은 취소합니다. 풀을 쓸 수 없으면 현재 프로세스에서 검색합니다.
+    """
+    global _analyze_pool
+    try:
+        pool = _get_analyze_pool()
+        futures = [
+            pool.submit(_scan_chunk, data[start:end])
+            for start, end in _split_chunks(data, ANALYZE_CHUNK_SIZE)
+        ]
+    except (OSError, RuntimeError):
+        yield from _iter_matches(data)
+        return
+
+    try:
+        for future in futures:
+            yield from future.result()
+    except BrokenProcessPool:
+        # 이미 내보낸 항목은 호출 측 중복 제거에서 걸러짐
+        _analyze_pool = None
+        yield from _iter_matches(data)
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def _find_ocr_errors(data) -> tuple:
+    """
+    UTF-8 HTML(bytes/mmap)에서 잠재적 OCR 오류 검색
+
+    한글 사이에 낀 오인식 문자를 찾으며 태그 내부는 제외합니다.
+    pyahocorasick이 있으면 오토마톤, 없으면 bytes 정규식으로 검색하고
+    중복은 검색 중에 바로 제거합니다. PARALLEL_ANALYZE_SIZE보다 큰 문서는
+    여러 프로세스에서 나눠 검색합니다.
+
+    Returns:
+        (오류 목록, MAX_REPORTED_ERRORS에서 검색을 멈췄는지 여부)
+    """
+    unique_errors = []
+    seen = set()
+    if len(data) > PARALLEL_ANALYZE_SIZE:
+        matches = _iter_matches_parallel(data)
+    else:
+        matches = _iter_matches(data)
+
+    for before, wrong, after, correct in matches:
+        context = before + wrong + after
+        key = (wrong, context)
+        if key in seen:
+            continue
+
+        # 최대 개수를 채우면 나머지 문서는 스캔하지 않음
+        if len(unique_errors) >= MAX_REPORTED_ERRORS:
+            return unique_errors, True
+
+        seen.add(key)
+        unique_errors.append({
+            "found": wrong,
+            "expected": correct,
+            "context": context,
+            "suggestion": before + correct + after
+        })
+
+    return unique_errors, False
+
+
+def _dump_bytes(obj: Any, indent: bool = True) -> bytes:
+    """JSON 직렬화 - UTF-8 bytes (orjson이 있으면 사용, 한글은 이스케이프하지 않음)"""
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
+
+
+def _dumps(obj: Any, indent: bool = True) -> str:
+    """JSON 직렬화 - 도구 반환용 문자열"""
+    if HAS_ORJSON:
+        return _dump_bytes(obj, indent).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
+
+
+def _loads(data: bytes) -> Any:
+    """JSON 파싱 (orjson이 있으면 사용)"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# list_documents 응답 캐시: {(status, offset, end): (조회한 목록들, JSON)}
+# 목록 객체는 _DIR_CACHE가 갱신될 때만 바뀌므로 객체 동일성으로 유효성 판단
+LIST_RESPONSE_CACHE_SIZE = 32
+_LIST_RESPONSE_CACHE: Dict[tuple, tuple] = {}
+
+# 문서 수정시각 표시 형식 (ISO 8601, 초 단위) - datetime 객체 없이 C 구현 strftime 사용
+_MTIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+# 폴더별 HTML 목록 캐시: {폴더: (폴더 mtime_ns, 조회 시각, 목록)}
+_DIR_CACHE: Dict[str, tuple] = {}
+
+
+def _invalidate_dir_cache(*directories: str):
+    """폴더 목록 캐시 무효화 (인자가 없으면 전체)"""
+    if not directories:
+        _DIR_CACHE.clear()
+    for directory in directories:
+        _DIR_CACHE.pop(directory, None)
+
+
+def _scan_html(directory: str) -> List[Dict[str, Any]]:
+    """
+    폴더 내 HTML 파일 목록 (파일명/크기/수정시각)
+
+    os.scandir의 DirEntry.stat()은 디렉토리 열거 시 얻은 정보를 재사용하므로
+    파일마다 별도 os.stat() 호출이 필요 없습니다.
+    폴더 mtime이 그대로면 DIR_CACHE_TTL 동안 이전 목록을 재사용합니다.
+    반환된 목록은 캐시와 공유되므로 수정하지 않아야 합니다.
+    """
+    try:
+        mtime_ns = os.stat(directory).st_mtime_ns
+    except FileNotFoundError:
+        return []
+
+    cached = _DIR_CACHE.get(directory)
+    now = time.monotonic()
+    if cached and cached[0] == mtime_ns and now - cached[1] < DIR_CACHE_TTL:
+        return cached[2]
+
+    documents = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if not entry.name.endswith('.html') or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                documents.append({
+                    "filename": entry.name,
+                    "size": stat.st_size,
+                    "modified": time.strftime(_MTIME_FORMAT, time.localtime(stat.st_mtime))
+                })
+    except FileNotFoundError:
+        return []
+
+    # 페이지 단위 조회 시 순서가 바뀌지 않도록 파일명 순 정렬
+    documents.sort(key=lambda doc: doc["filename"])
+    _DIR_CACHE[directory] = (mtime_ns, now, documents)
+    return documents
+
+
+# 검수 통계 캐시 - 메모리에서 갱신하고 STATS_FLUSH_EVERY회마다, 그리고 종료 시 파일에 기록
+STATS_FLUSH_EVERY = 10
+_stats_cache: Optional[Dict[str, Any]] = None
+_stats_dirty = 0
+
+
+def _load_stats() -> Dict[str, Any]:
+    """검수 통계 (최초 1회만 파일에서 읽음)"""
+    global _stats_cache
+    if _stats_cache is None:
+        try:
+            with open(STATS_FILE, 'rb') as f:
+                stats = _loads(f.read())
+        except FileNotFoundError:
             stats = {
                 "total_reviewed": 0,
                 "total_corrections": 0,
                 "common_errors": {},
-                "reviews": []
+                "last_updated": None
             }
+        stats.setdefault("reviews", [])
+        _stats_cache = stats
+    return _stats_cache
+
+
+def _flush_stats():
+    """변경된 검수 통계를 파일에 기록"""
+    global _stats_dirty
+    if _stats_cache is None or not _stats_dirty:
+        return
+    try:
+        # 종료/폴더 변경 중 중단되어도 기존 통계 파일이 잘리지 않도록 원자적 저장
+        _write_atomic(STATS_FILE, _dump_bytes(_stats_cache))
+        _stats_dirty = 0
+    except Exception:
+        pass  # 통계 실패는 무시
+
+
+atexit.register(_flush_stats)
+
+
+def _reset_stats():
+    """작업 디렉토리 변경 시 이전 통계를 기록하고 캐시 초기화"""
+    global _stats_cache
+    _flush_stats()
+    _stats_cache = None
+
+
+def _update_stats(filename: str, content: str = None, corrections: Dict[str, int] = None):
+    """검수 통계 업데이트 (corrections: 자동 교정 시 패턴별 수정 건수)"""
+    global _stats_dirty
+    try:
+        stats = _load_stats()
 
         stats["total_reviewed"] += 1
+        if corrections:
+            stats["total_corrections"] += sum(corrections.values())
+            common_errors = stats["common_errors"]
+            for key, count in corrections.items():
+                common_errors[key] = common_errors.get(key, 0) + count
         stats["last_updated"] = datetime.now().isoformat()
         stats["reviews"].append({
             "filename": filename,
@@ -443,8 +885,9 @@ def _update_stats(filename: str, content: str):
         # 최근 100개만 유지
         stats["reviews"] = stats["reviews"][-100:]
 
-        with open(STATS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(stats, f, ensure_ascii=False, indent=2)
+        _stats_dirty += 1
+        if _stats_dirty >= STATS_FLUSH_EVERY:
+            _flush_stats()
 
     except Exception:
         pass  # 통계 실패는 무시
@@ -468,6 +911,7 @@ def get_review_system_prompt() -> str:
 - read_document: 문서 내용 읽기
 - analyze_ocr_errors: 잠재적 OCR 오류 분석
 - save_reviewed_document: 검수 완료 문서 저장
+- auto_correct_document: 한글 사이 여러 글자 영문·한자 오인식만 일괄 자동 수정 후 저장
 - get_review_stats: 검수 통계 조회
 
 작업을 시작하려면 'list_documents()'를 호출하세요."""
@@ -476,7 +920,7 @@ def get_review_system_prompt() -> str:
 @mcp.resource("prompts://error-patterns")
 def get_error_patterns() -> str:
     """오류 패턴 목록"""
-    return json.dumps(OCR_ERROR_PATTERNS, ensure_ascii=False, indent=2)
+    return _dumps(OCR_ERROR_PATTERNS)
 
 
 # ============================================================
@@ -17,11 +17,21 @@ import json
 import time
 import base64
 import zipfile
-from typing import Dict, Any, Optional, Tuple
+import importlib
+import multiprocessing
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple, List
 from xml.etree import ElementTree as ET
 
 import requests
 
+# 빠른 XML 파싱 (선택: lxml - libxml2 기반, 없으면 ElementTree)
+try:
+    from lxml import etree as LET
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
 # Clean HTML 및 마크다운 변환용
 try:
     from cleaner import ContentCleaner
@@ -58,6 +68,121 @@ except ImportError:
     HAS_GEMINI_CORRECTION = False
 
 
+# XLSX 시트 XML의 병합 셀 요소
+_XLSX_MERGE_CELL_TAG = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}mergeCell'
+
+# 확장자별 변환 메서드 (PDF/이미지는 분석·API 키 확인이 필요해 process에서 따로 처리)
+_HANDLERS = {
+    '.xlsx': '_convert_excel', '.xls': '_convert_excel',
+    '.docx': '_convert_word', '.doc': '_convert_word',
+    '.pptx': '_convert_powerpoint', '.ppt': '_convert_powerpoint',
+    '.hwpx': '_convert_hwp', '.hwp': '_convert_hwp',
+}
+# 작업 프로세스에서 변환할 수 있는 확장자 (CPU 작업만 하는 로컬 변환, .hwp는 Upstage API 사용)
+_POOL_EXTENSIONS = frozenset(_HANDLERS) - {'.hwp'}
+_IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif', '.gif', '.webp'})
+
+# _clean_text용 공백 정규식 / HTML 이스케이프 변환표
+_WS_RE = re.compile(r'\s+')
+_HTML_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+# 색상 변환 캐시 (문서 전체에서 같은 색상 값이 반복되므로 한 번만 변환)
+_RGB_CACHE: Dict[str, str] = {}
+_SHADING_CSS_CACHE: Dict[str, str] = {}
+
+
+def _argb_to_rgb(color: str) -> str:
+    """Excel ARGB 색상 → RGB 16진수 (8자리면 알파 제거)"""
+    rgb = _RGB_CACHE.get(color)
+    if rgb is None:
+        rgb = _RGB_CACHE[color] = color[2:] if len(color) == 8 else color
+    return rgb
+
+
+def _shading_css(fill: str) -> str:
+    """Word 셀 음영 fill 값 → background-color CSS (auto/흰색이면 빈 문자열)"""
+    css = _SHADING_CSS_CACHE.get(fill)
+    if css is None:
+        css = '' if fill.lower() in ('auto', 'ffffff') else f'background-color: #{fill}'
+        _SHADING_CSS_CACHE[fill] = css
+    return css
+
+
+# OOXML/HWPX 네임스페이스
+_W_NSMAP = {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'}
+_A_NSMAP = {'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'}
+_HP_NS = 'http://www.hancom.co.kr/hwpml/2011/paragraph'
+_HP_NSMAP = {'hp': _HP_NS}
+
+# HWPX 테이블 행/셀 태그 (Clark 표기, 한 번만 생성)
+_HP_TR = f'{{{_HP_NS}}}tr'
+_HP_TC = f'{{{_HP_NS}}}tc'
+
+# XML 파서: lxml이 있으면 사용
+# (외부 엔티티/네트워크 접근 차단, 주석/처리 지시문 제거 - ElementTree 기본 동작과 동일)
+if HAS_LXML:
+    _XML_PARSER = LET.XMLParser(resolve_entities=False, no_network=True,
+                                remove_comments=True, remove_pis=True)
+
+    def _parse_xml(data):
+        return LET.fromstring(data, _XML_PARSER)
+else:
+    _parse_xml = ET.fromstring
+
+
+def _compile_finder(path: str, namespaces: Dict[str, str]):
+    """요소 검색 함수 (lxml이 있으면 한 번 컴파일한 XPath, 없으면 ElementTree findall)"""
+    if HAS_LXML:
+        return LET.XPath(path, namespaces=namespaces)
+    return lambda tree: tree.findall(path, namespaces)
+
+
+# 지연 import 캐시 {모듈 이름: 모듈 또는 None(미설치)}
+_LAZY_MODULES: Dict[str, Any] = {}
+
+
+def _lazy_import(name: str):
+    """
+    무거운 선택 라이브러리를 처음 필요할 때 한 번만 import
+
+    결과(미설치 시 None 포함)를 프로세스 단위로 캐시하므로, 설치되지 않은 모듈을
+    파일마다 sys.path에서 다시 찾지 않습니다.
+    """
+    try:
+        return _LAZY_MODULES[name]
+    except KeyError:
+        pass
+
+    try:
+        module = importlib.import_module(name)
+    except ImportError:
+        module = None
+    _LAZY_MODULES[name] = module
+    return module
+
+
+def _import_pymupdf():
+    """PyMuPDF 모듈 (설치되지 않았으면 None)"""
+    if 'pymupdf' not in _LAZY_MODULES:
+        pymupdf = _lazy_import('pymupdf') or _lazy_import('fitz')  # fitz: 구버전 PyMuPDF
+
+        # 레이아웃 패키지 안내문이 stdout(JSON 메시지 채널)으로 출력되지 않도록 끔
+        if pymupdf is not None and hasattr(pymupdf, 'no_recommend_layout'):
+            pymupdf.no_recommend_layout()
+        _LAZY_MODULES['pymupdf'] = pymupdf
+    return _LAZY_MODULES['pymupdf']
+
+
+_find_word_paragraphs = _compile_finder('.//w:p', _W_NSMAP)
+_find_word_texts = _compile_finder('.//w:t', _W_NSMAP)
+# 셀 속성(w:tcPr) 바로 아래만 검색 (중첩 테이블/단락 음영은 제외)
+_find_cell_vmerge = _compile_finder('./w:tcPr/w:vMerge', _W_NSMAP)
+_find_cell_shading = _compile_finder('./w:tcPr/w:shd', _W_NSMAP)
+_find_pptx_texts = _compile_finder('.//a:t', _A_NSMAP)
+_find_hwpx_paragraphs = _compile_finder('.//hp:p', _HP_NSMAP)
+_find_hwpx_tables = _compile_finder('.//hp:tbl', _HP_NSMAP)
+
+
 class FileProcessor:
     """하이브리드 문서 처리기"""
 
@@ -74,7 +199,8 @@ class FileProcessor:
                  check_credits: bool = True,
                  api_key: str = None,
                  gemini_api_key: str = None,
-                 enable_gemini_correction: bool = True):
+                 enable_gemini_correction: bool = True,
+                 preserve_excel_styles: bool = True):
         """
         FileProcessor 초기화
 
@@ -86,11 +212,14 @@ class FileProcessor:
             api_key: (deprecated) 하위호환용 - 관리자 설정에서 자동 로드됨
             gemini_api_key: Gemini API 키 (교정 기능용)
             enable_gemini_correction: Gemini 자동 교정 활성화 여부
+            preserve_excel_styles: Excel 셀 서식(색상/글꼴/테두리) 보존 여부
+                (False면 서식 없이 값만 빠르게 변환)
         """
         self.output_folder = output_folder
         self.generate_clean_html = generate_clean_html
         self.generate_markdown = generate_markdown
         self.check_credits = check_credits
+        self.styles_required = preserve_excel_styles
 
         # 관리자 설정에서 Upstage API 키 로드
         if HAS_ADMIN_CONFIG:
@@ -121,6 +250,46 @@ class FileProcessor:
         else:
             self.rate_limiter = None
 
+        # Upstage API용 HTTP 세션 (keep-alive로 분할 청크 간 TLS 연결 재사용, 첫 호출 시 생성)
+        self._http = None
+
+        # 로컬 변환 작업 프로세스 풀 (create_convert_pool로 생성해 설정, 없으면 현재 프로세스에서 변환)
+        self.convert_pool: Optional[Executor] = None
+
+    def _get_http_session(self) -> requests.Session:
+        """Upstage API용 HTTP 세션 (API 호출은 순차 처리이므로 세션 하나를 공유)"""
+        if self._http is None:
+            self._http = requests.Session()
+        return self._http
+
+    def close(self):
+        """HTTP 세션 등 리소스 정리"""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
+    @staticmethod
+    def create_convert_pool(max_workers: int = None, preserve_excel_styles: bool = True) -> ProcessPoolExecutor:
+        """
+        로컬 변환(Excel/Word/PPT/HWPX)용 작업 프로세스 풀 생성
+
+        문서 파싱(XML 파싱 + 문자열 생성)은 CPU 작업이므로 여러 코어에서 나눠 처리합니다.
+        작업 프로세스마다 변환 전용 FileProcessor를 한 번만 생성하므로 Cleaner 등을
+        피클링하지 않습니다. 크레딧 차감/Gemini 교정/저장과 Upstage API 호출은 공유 상태
+        (크레딧 파일, Rate Limiter)가 필요하므로 현재 프로세스에서 처리합니다.
+        스레드가 실행 중인 프로세스에서 fork하지 않도록 spawn 방식으로 생성합니다.
+
+        Args:
+            max_workers: 작업 프로세스 수 (기본: CPU 코어 수)
+            preserve_excel_styles: Excel 셀 서식 보존 여부
+        """
+        return ProcessPoolExecutor(
+            max_workers=max_workers or os.cpu_count(),
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_convert_worker,
+            initargs=(preserve_excel_styles,)
+        )
+
     def process(self, file_path: str) -> Dict[str, Any]:
         """
         파일 처리 메인 함수
@@ -134,9 +303,39 @@ class FileProcessor:
                 ├── clean_ai.html   (AI 학습용 - JS/CSS 제거)
                 └── content.md      (마크다운 - 노트앱 호환)
         """
+        job = self._convert_job(file_path)
+        if job["status"] == "fail":
+            return job
+        return self._save_job_outputs(job)
+
+    def process_deferred(self, file_path: str, output_executor: Executor) -> Future:
+        """
+        파일 처리 (출력 저장은 다른 스레드에서)
+
+        변환(Upstage API 호출 포함)은 현재 스레드에서 하고, Clean HTML/Markdown 생성과
+        파일 저장은 output_executor에 넘깁니다. API 워커는 곧바로 다음 파일 업로드를
+        시작할 수 있습니다.
+
+        Returns:
+            process()와 같은 결과 Dict를 담을 Future
+        """
+        job = self._convert_job(file_path)
+        if job["status"] == "fail":
+            future = Future()
+            future.set_result(job)
+            return future
+        return output_executor.submit(self._save_job_outputs, job)
+
+    def _convert_job(self, file_path: str) -> Dict[str, Any]:
+        """
+        파일 변환 단계 (변환 → 크레딧 차감 → Gemini 교정)
+
+        Returns:
+            성공 시 status "converted"와 저장 단계에 필요한 정보, 실패 시 process() 실패 결과
+        """
         filename = os.path.basename(file_path)
-        doc_name = os.path.splitext(filename)[0]
-        ext = os.path.splitext(filename)[1].lower()
+        doc_name, ext = os.path.splitext(filename)
+        ext = ext.lower()
 
         # 파일별 출력 폴더 생성
         doc_folder = os.path.join(self.output_folder, doc_name)
@@ -144,33 +343,28 @@ class FileProcessor:
 
         start_time = time.time()
         method = "Local"
-        outputs = []
 
         try:
             content = ""
 
             # 확장자별 라우팅
-            if ext in ('.xlsx', '.xls'):
-                content = self._convert_excel(file_path)
-
-            elif ext in ('.docx', '.doc'):
-                content = self._convert_word(file_path)
-
-            elif ext in ('.pptx', '.ppt'):
-                content = self._convert_powerpoint(file_path)
-
-            elif ext in ('.hwpx', '.hwp'):
-                content = self._convert_hwp(file_path)
+            handler_name = _HANDLERS.get(ext)
+            if handler_name:
+                if self.convert_pool is not None and ext in _POOL_EXTENSIONS:
+                    # CPU 작업인 변환만 작업 프로세스에서 실행 (결과를 기다린 뒤 이후 단계는 여기서)
+                    content = self.convert_pool.submit(_convert_in_worker, file_path).result()
+                else:
+                    content = getattr(self, handler_name)(file_path)
 
             elif ext == '.pdf':
-                is_digital, text_ratio = self._analyze_pdf(file_path)
+                is_digital, text_ratio, page_texts = self._analyze_pdf(file_path)
                 if is_digital:
-                    content = self._convert_digital_pdf(file_path)
+                    content = self._convert_digital_pdf(file_path, prefetched=page_texts)
                 else:
                     method = "Upstage API"
                     content = self._convert_image_pdf_upstage(file_path)
 
-            elif ext in ('.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif', '.gif', '.webp'):
+            elif ext in _IMAGE_EXTENSIONS:
                 # 이미지 파일 → Upstage API로 OCR
                 if self.api_key:
                     method = "Upstage API"
@@ -210,6 +404,32 @@ class FileProcessor:
                             "msg": f"Gemini 교정 실패 (원본 유지): {str(e)}"
                         }), file=sys.stderr, flush=True)
 
+            return {
+                "status": "converted",
+                "file": filename,
+                "method": method,
+                "start_time": start_time,
+                "output": doc_folder,
+                "content": content
+            }
+
+        except Exception as e:
+            return {
+                "status": "fail",
+                "file": filename,
+                "method": method,
+                "error": str(e)
+            }
+
+    def _save_job_outputs(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """파일 처리 저장 단계 (3-Way Output 저장)"""
+        filename = job["file"]
+        method = job["method"]
+        doc_folder = job["output"]
+        content = job["content"]
+        outputs = []
+
+        try:
             # === 3-Way Output 저장 ===
 
             # 1. View HTML (원본 서식용)
@@ -238,7 +458,7 @@ class FileProcessor:
                     f.write(markdown)
                 outputs.append("content.md")
 
-            elapsed = round(time.time() - start_time, 2)
+            elapsed = round(time.time() - job["start_time"], 2)
             return {
                 "status": "success",
                 "file": filename,
@@ -260,89 +480,150 @@ class FileProcessor:
     # Excel 처리
     # ============================================================
     def _convert_excel(self, file_path: str) -> str:
-        """Excel을 HTML 테이블로 변환 (서식 완벽 보존)"""
-        try:
-            import pandas as pd
-            from openpyxl import load_workbook
-            from openpyxl.utils import get_column_letter
-        except ImportError:
+        """
+        Excel을 HTML 테이블로 변환 (서식 완벽 보존)
+
+        read_only 모드로 행을 순차 스트리밍하므로 전체 셀 객체 모델을 메모리에
+        올리지 않습니다. (read_only 셀도 글꼴/채우기/테두리/정렬 정보는 제공)
+        """
+        # 서식이 필요 없거나 .xls(openpyxl 미지원)면 값만 빠르게 변환
+        if not self.styles_required or file_path.lower().endswith('.xls'):
+            return self._fallback_excel(file_path)
+
+        openpyxl = _lazy_import('openpyxl')
+        if openpyxl is None:
             return self._fallback_excel(file_path)
 
-        wb = load_workbook(file_path, data_only=True)
+        wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            return self._render_excel_workbook(wb)
+        finally:
+            wb.close()  # read_only 모드는 파일 핸들을 유지하므로 명시적으로 닫음
+
+    def _render_excel_workbook(self, wb) -> str:
+        """
+        읽기 전용 워크북을 HTML 테이블로 변환
+
+        read_only 시트는 <dimension> 요소를 그대로 믿으므로(오래되었거나 없을 수 있음)
+        reset_dimensions()로 실제 셀을 모두 읽고, 각 행을 실제 최대 열까지 빈 셀로 채웁니다.
+        """
+        from openpyxl.cell.read_only import EMPTY_CELL
+
         html_parts = []
 
+        # 셀 스타일 캐시 {스타일 인덱스: CSS 문자열}
+        # 스타일 인덱스는 워크북 단위이므로 워크북마다 새로 만듦 (빈 셀은 None 키)
+        style_cache = {}
+
         for sheet_name in wb.sheetnames:
             ws = wb[sheet_name]
             html_parts.append(f'<div class="sheet" data-sheet="{sheet_name}">')
             html_parts.append(f'<h2 class="sheet-title">{sheet_name}</h2>')
 
-            # 병합 셀 정보 수집
+            # 병합 셀 정보 수집 (시작 셀 → span, 나머지 셀 → 스킵 집합)
             merged_ranges = {}
-            for merged_range in ws.merged_cells.ranges:
-                min_col, min_row, max_col, max_row = merged_range.bounds
+            skip_cells = set()
+            for min_col, min_row, max_col, max_row in self._read_merged_ranges(ws):
                 merged_ranges[(min_row, min_col)] = (
                     max_row - min_row + 1,
                     max_col - min_col + 1
                 )
+                skip_cells.update(
+                    (r, c)
+                    for r in range(min_row, max_row + 1)
+                    for c in range(min_col, max_col + 1)
+                )
+                skip_cells.discard((min_row, min_col))
 
             html_parts.append('<table class="excel-table">')
 
+            def render_cell(row_idx: int, col_idx: int, cell) -> Optional[str]:
+                """셀 하나를 <td>로 변환 (병합 범위 내 다른 셀은 None)"""
+                # 병합된 셀 처리
+                if (row_idx, col_idx) in merged_ranges:
+                    rowspan, colspan = merged_ranges[(row_idx, col_idx)]
+                    span_attrs = f' rowspan="{rowspan}" colspan="{colspan}"'
+                elif (row_idx, col_idx) in skip_cells:
+                    # 병합 범위 내 다른 셀은 스킵
+                    return None
+                else:
+                    span_attrs = ""
+
+                # 셀 스타일 추출 (같은 스타일 인덱스는 한 번만 계산)
+                style_key = getattr(cell, '_style_id', None)
+                style = style_cache.get(style_key)
+                if style is None:
+                    style = style_cache[style_key] = self._extract_cell_style(cell)
+                value = cell.value if cell.value is not None else ""
+
+                return f'<td{span_attrs} style="{style}">{value}</td>'
+
+            # 실제 셀 기준으로 행 읽기 (최대 열은 다 읽은 뒤에야 알 수 있으므로 행별로 모아 둠)
+            ws.reset_dimensions()
+            rows = []
+            max_row = max_col = 0
+            for (min_row, min_col), (rowspan, colspan) in merged_ranges.items():
+                max_row = max(max_row, min_row + rowspan - 1)
+                max_col = max(max_col, min_col + colspan - 1)
             for row_idx, row in enumerate(ws.iter_rows(), start=1):
-                html_parts.append('<tr>')
-                for col_idx, cell in enumerate(row, start=1):
-                    # 병합된 셀 처리
-                    if (row_idx, col_idx) in merged_ranges:
-                        rowspan, colspan = merged_ranges[(row_idx, col_idx)]
-                        span_attrs = f' rowspan="{rowspan}" colspan="{colspan}"'
-                    else:
-                        # 병합 범위 내 다른 셀은 스킵
-                        skip = False
-                        for (mr, mc), (rs, cs) in merged_ranges.items():
-                            if mr <= row_idx < mr + rs and mc <= col_idx < mc + cs:
-                                if (row_idx, col_idx) != (mr, mc):
-                                    skip = True
-                                    break
-                        if skip:
-                            continue
-                        span_attrs = ""
-
-                    # 셀 스타일 추출
-                    style = self._extract_cell_style(cell)
-                    value = cell.value if cell.value is not None else ""
+                rows.append([render_cell(row_idx, col_idx, cell) for col_idx, cell in enumerate(row, start=1)])
+                max_col = max(max_col, len(row))
+            max_row = max(max_row, len(rows))
 
-                    html_parts.append(f'<td{span_attrs} style="{style}">{value}</td>')
+            for row_idx in range(1, max_row + 1):
+                cells = rows[row_idx - 1] if row_idx <= len(rows) else []
+                # 빈 셀로 최대 열까지 채움 (병합 범위는 그대로 반영)
+                cells.extend(render_cell(row_idx, col_idx, EMPTY_CELL)
+                             for col_idx in range(len(cells) + 1, max_col + 1))
 
+                html_parts.append('<tr>')
+                html_parts.extend(cell_html for cell_html in cells if cell_html is not None)
                 html_parts.append('</tr>')
 
             html_parts.append('</table></div>')
 
         return '\n'.join(html_parts)
 
+    @staticmethod
+    def _read_merged_ranges(ws) -> list:
+        """
+        읽기 전용 시트의 병합 셀 범위 [(min_col, min_row, max_col, max_row), ...]
+
+        read_only 시트는 merged_cells를 제공하지 않으므로 시트 XML을 스트리밍하며
+        mergeCell 요소만 수집합니다.
+        """
+        from openpyxl.utils.cell import range_boundaries
+
+        ranges = []
+        with ws._get_source() as src:
+            for _, elem in ET.iterparse(src):
+                if elem.tag == _XLSX_MERGE_CELL_TAG:
+                    ranges.append(range_boundaries(elem.get('ref')))
+                elem.clear()
+        return ranges
+
     def _extract_cell_style(self, cell) -> str:
         """셀 스타일 추출"""
         styles = []
 
         try:
             # 배경색
-            if cell.fill and cell.fill.fgColor and cell.fill.fgColor.rgb:
-                if cell.fill.fgColor.rgb != '00000000':
-                    color = cell.fill.fgColor.rgb
-                    if len(color) == 8:
-                        color = color[2:]  # ARGB -> RGB
-                    styles.append(f'background-color: #{color}')
+            fill = cell.fill
+            if fill and fill.fgColor and fill.fgColor.rgb:
+                if fill.fgColor.rgb != '00000000':
+                    styles.append(f'background-color: #{_argb_to_rgb(fill.fgColor.rgb)}')
 
             # 글꼴
-            if cell.font:
-                if cell.font.bold:
+            font = cell.font
+            if font:
+                if font.bold:
                     styles.append('font-weight: bold')
-                if cell.font.italic:
+                if font.italic:
                     styles.append('font-style: italic')
-                if cell.font.size:
-                    styles.append(f'font-size: {cell.font.size}pt')
-                if cell.font.color and cell.font.color.rgb:
-                    color = cell.font.color.rgb
-                    if len(color) == 8:
-                        color = color[2:]
+                if font.size:
+                    styles.append(f'font-size: {font.size}pt')
+                if font.color and font.color.rgb:
+                    color = _argb_to_rgb(font.color.rgb)
                     if color != '000000':
                         styles.append(f'color: #{color}')
 
@@ -384,13 +665,24 @@ class FileProcessor:
         return '; '.join(borders)
 
     def _fallback_excel(self, file_path: str) -> str:
-        """Pandas 폴백"""
+        """
+        Pandas 폴백 (서식 없이 값만 변환)
+
+        python-calamine이 설치되어 있으면 Rust 기반 calamine 엔진으로 읽습니다.
+        """
         import pandas as pd
-        dfs = pd.read_excel(file_path, sheet_name=None)
+        try:
+            dfs = pd.read_excel(file_path, sheet_name=None, engine="calamine")
+        except (ImportError, ValueError):
+            # python-calamine 미설치 또는 calamine 미지원 pandas 버전
+            dfs = pd.read_excel(file_path, sheet_name=None)
+
         html_parts = []
         for sheet_name, df in dfs.items():
-            html_parts.append(f'<h2>{sheet_name}</h2>')
-            html_parts.append(df.to_html(index=False, border=1, classes='excel-table'))
+            html_parts.append(f'<div class="sheet" data-sheet="{sheet_name}">')
+            html_parts.append(f'<h2 class="sheet-title">{sheet_name}</h2>')
+            html_parts.append(df.to_html(index=False, border=1, classes='excel-table', na_rep=''))
+            html_parts.append('</div>')
         return '\n'.join(html_parts)
 
     # ============================================================
@@ -398,30 +690,29 @@ class FileProcessor:
     # ============================================================
     def _convert_word(self, file_path: str) -> str:
         """Word 문서를 HTML로 변환"""
-        try:
-            from docx import Document
-            from docx.enum.text import WD_ALIGN_PARAGRAPH
-            from docx.enum.table import WD_TABLE_ALIGNMENT
-        except ImportError:
+        docx = _lazy_import('docx')
+        if docx is None:
             return self._convert_word_basic(file_path)
 
-        doc = Document(file_path)
+        doc = docx.Document(file_path)
         html_parts = []
 
+        # XML 요소 → 단락/테이블 객체 색인 (요소마다 전체 목록을 다시 훑지 않도록)
+        para_by_elem = {para._element: para for para in doc.paragraphs}
+        table_by_elem = {table._tbl: table for table in doc.tables}
+
         for element in doc.element.body:
             if element.tag.endswith('p'):
                 # 단락 처리
-                for para in doc.paragraphs:
-                    if para._element == element:
-                        html_parts.append(self._convert_paragraph(para))
-                        break
+                para = para_by_elem.get(element)
+                if para is not None:
+                    html_parts.append(self._convert_paragraph(para))
 
             elif element.tag.endswith('tbl'):
                 # 테이블 처리
-                for table in doc.tables:
-                    if table._tbl == element:
-                        html_parts.append(self._convert_table(table))
-                        break
+                table = table_by_elem.get(element)
+                if table is not None:
+                    html_parts.append(self._convert_table(table))
 
         return '\n'.join(html_parts)
 
@@ -469,17 +760,15 @@ class FileProcessor:
         has_border = self._detect_table_border(table)
         border_class = 'bordered' if has_border else 'borderless'
 
-        html = f'<table class="word-table {border_class}">'
+        parts = [f'<table class="word-table {border_class}">']
 
         for row in table.rows:
-            html += '<tr>'
+            parts.append('<tr>')
             for cell in row.cells:
                 # 셀 병합 처리
-                cell_html = '<td'
-
                 # 수직 병합
                 if hasattr(cell, '_tc'):
-                    vmerge = cell._tc.xpath('.//w:vMerge')
+                    vmerge = _find_cell_vmerge(cell._tc)
                     if vmerge:
                         # 병합 시작 셀이 아니면 스킵
                         if vmerge[0].get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val') is None:
@@ -487,17 +776,14 @@ class FileProcessor:
 
                 # 셀 배경색
                 style = self._get_cell_shading(cell)
-                if style:
-                    cell_html += f' style="{style}"'
+                style_attr = f' style="{style}"' if style else ''
 
-                cell_html += '>'
-                cell_html += '<br>'.join([p.text or '' for p in cell.paragraphs])
-                cell_html += '</td>'
-                html += cell_html
-            html += '</tr>'
+                cell_text = '<br>'.join(p.text or '' for p in cell.paragraphs)
+                parts.append(f'<td{style_attr}>{cell_text}</td>')
+            parts.append('</tr>')
 
-        html += '</table>'
-        return html
+        parts.append('</table>')
+        return ''.join(parts)
 
     def _detect_table_border(self, table) -> bool:
         """테이블 테두리 유무 감지"""
@@ -515,11 +801,11 @@ class FileProcessor:
     def _get_cell_shading(self, cell) -> str:
         """셀 음영 추출"""
         try:
-            shading = cell._tc.xpath('.//w:shd')
+            shading = _find_cell_shading(cell._tc)
             if shading:
                 fill = shading[0].get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}fill')
-                if fill and fill.lower() not in ('auto', 'ffffff'):
-                    return f'background-color: #{fill}'
+                if fill:
+                    return _shading_css(fill)
         except:
             pass
         return ""
@@ -531,15 +817,14 @@ class FileProcessor:
             with zipfile.ZipFile(file_path) as zf:
                 if 'word/document.xml' in zf.namelist():
                     xml_content = zf.read('word/document.xml')
-                    tree = ET.fromstring(xml_content)
+                    tree = _parse_xml(xml_content)
 
                     # 텍스트만 추출
-                    ns = {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'}
-                    paragraphs = tree.findall('.//w:p', ns)
+                    paragraphs = _find_word_paragraphs(tree)
 
                     html = ""
                     for para in paragraphs:
-                        texts = para.findall('.//w:t', ns)
+                        texts = _find_word_texts(para)
                         text = ''.join([t.text or '' for t in texts])
                         if text.strip():
                             html += f'<p>{text}</p>\n'
@@ -553,13 +838,11 @@ class FileProcessor:
     # ============================================================
     def _convert_powerpoint(self, file_path: str) -> str:
         """PowerPoint를 HTML로 변환"""
-        try:
-            from pptx import Presentation
-            from pptx.util import Inches, Pt
-        except ImportError:
+        pptx = _lazy_import('pptx')
+        if pptx is None:
             return self._convert_pptx_basic(file_path)
 
-        prs = Presentation(file_path)
+        prs = pptx.Presentation(file_path)
         html_parts = []
 
         for slide_num, slide in enumerate(prs.slides, 1):
@@ -586,15 +869,15 @@ class FileProcessor:
 
     def _convert_pptx_table(self, table) -> str:
         """PPTX 테이블 변환"""
-        html = '<table class="pptx-table">'
+        parts = ['<table class="pptx-table">']
         for row in table.rows:
-            html += '<tr>'
+            parts.append('<tr>')
             for cell in row.cells:
                 text = cell.text if cell.text else ''
-                html += f'<td>{text}</td>'
-            html += '</tr>'
-        html += '</table>'
-        return html
+                parts.append(f'<td>{text}</td>')
+            parts.append('</tr>')
+        parts.append('</table>')
+        return ''.join(parts)
 
     def _convert_pptx_basic(self, file_path: str) -> str:
         """기본 PPTX 변환"""
@@ -606,11 +889,10 @@ class FileProcessor:
 
             for i, slide_file in enumerate(slide_files, 1):
                 xml_content = zf.read(slide_file)
-                tree = ET.fromstring(xml_content)
+                tree = _parse_xml(xml_content)
 
                 # 모든 텍스트 추출
-                ns = {'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'}
-                texts = tree.findall('.//a:t', ns)
+                texts = _find_pptx_texts(tree)
 
                 html_parts.append(f'<div class="slide"><h2>Slide {i}</h2>')
                 for t in texts:
@@ -652,17 +934,10 @@ class FileProcessor:
 
                 for section_file in section_files:
                     xml_content = zf.read(section_file)
-                    tree = ET.fromstring(xml_content)
-
-                    # HWPX 네임스페이스
-                    ns = {
-                        'hp': 'http://www.hancom.co.kr/hwpml/2011/paragraph',
-                        'ht': 'http://www.hancom.co.kr/hwpml/2011/tail',
-                        'hc': 'http://www.hancom.co.kr/hwpml/2011/core'
-                    }
+                    tree = _parse_xml(xml_content)
 
                     # 단락 추출
-                    paragraphs = tree.findall('.//{http://www.hancom.co.kr/hwpml/2011/paragraph}p')
+                    paragraphs = _find_hwpx_paragraphs(tree)
                     if not paragraphs:
                         # 네임스페이스 없이 시도
                         paragraphs = tree.findall('.//p')
@@ -681,7 +956,7 @@ class FileProcessor:
                             html_parts.append(f'<p>{text}</p>')
 
                     # 테이블 추출
-                    tables = tree.findall('.//{http://www.hancom.co.kr/hwpml/2011/paragraph}tbl')
+                    tables = _find_hwpx_tables(tree)
                     for tbl in tables:
                         html_parts.append(self._convert_hwpx_table(tbl))
 
@@ -692,12 +967,12 @@ class FileProcessor:
 
     def _convert_hwpx_table(self, tbl) -> str:
         """HWPX 테이블 변환"""
-        html = '<table class="hwp-table">'
-        rows = tbl.findall('.//{http://www.hancom.co.kr/hwpml/2011/paragraph}tr')
+        parts = ['<table class="hwp-table">']
+        rows = tbl.iter(_HP_TR)
 
         for row in rows:
-            html += '<tr>'
-            cells = row.findall('.//{http://www.hancom.co.kr/hwpml/2011/paragraph}tc')
+            parts.append('<tr>')
+            cells = row.iter(_HP_TC)
 
             for cell in cells:
                 # 텍스트 추출
@@ -706,62 +981,197 @@ class FileProcessor:
                     if elem.text:
                         texts.append(elem.text)
                 text = ''.join(texts).strip()
-                html += f'<td>{text}</td>'
+                parts.append(f'<td>{text}</td>')
 
-            html += '</tr>'
+            parts.append('</tr>')
 
-        html += '</table>'
-        return html
+        parts.append('</table>')
+        return ''.join(parts)
 
     # ============================================================
     # PDF 처리
     # ============================================================
-    def _analyze_pdf(self, file_path: str) -> Tuple[bool, float]:
+    def _analyze_pdf(self, file_path: str) -> Tuple[bool, float, Dict[int, Any]]:
         """
         PDF 타입 분석
 
+        PyMuPDF(fitz)가 있으면 C 레벨 추출기로 빠르게 판정하고,
+        없으면 pdfplumber로 판정한다.
+
         Returns:
-            (is_digital, text_ratio): 디지털 PDF 여부와 텍스트 비율
+            (is_digital, text_ratio, page_texts): 디지털 PDF 여부, 텍스트 비율,
+            _convert_digital_pdf에서 재사용할 수 있는 샘플 페이지 데이터
+            {페이지 인덱스: 텍스트 블록 목록(PyMuPDF) 또는 텍스트(pdfplumber)}
         """
+        fitz = _import_pymupdf()
+        if fitz is None:
+            return self._analyze_pdf_plumber(file_path)
+
         try:
-            import pdfplumber
-        except ImportError:
+            with fitz.open(file_path) as doc:
+                if doc.page_count == 0:
+                    return False, 0.0, {}
+
+                # 처음 3페이지만 샘플링 (변환과 같은 블록 단위로 추출해 변환 시 재사용)
+                page_blocks = {}
+                sample_sizes = []
+                for page_index in range(min(3, doc.page_count)):
+                    page = doc[page_index]
+                    blocks = self._pdf_text_blocks(fitz, page)
+                    page_blocks[page_index] = blocks
+                    text = '\n'.join(
+                        self._pdf_block_text(block) for block in blocks if block.get("type") == 0
+                    )
+                    sample_sizes.append((text, page.rect.width, page.rect.height))
+
+                is_digital, text_ratio = self._judge_pdf_text_density(sample_sizes)
+                return is_digital, text_ratio, page_blocks
+
+        except Exception:
+            return False, 0.0, {}
+
+    def _analyze_pdf_plumber(self, file_path: str) -> Tuple[bool, float, Dict[int, str]]:
+        """PDF 타입 분석 (pdfplumber 사용, PyMuPDF 없을 때)"""
+        pdfplumber = _lazy_import('pdfplumber')
+        if pdfplumber is None:
             # pdfplumber 없으면 무조건 Upstage 사용
-            return False, 0.0
+            return False, 0.0, {}
 
         try:
             with pdfplumber.open(file_path) as pdf:
                 if not pdf.pages:
-                    return False, 0.0
+                    return False, 0.0, {}
 
-                # 처음 3페이지만 샘플링
+                # 처음 3페이지만 샘플링 (추출한 텍스트는 변환 시 재사용)
                 sample_pages = pdf.pages[:min(3, len(pdf.pages))]
-                total_text_len = 0
-                total_chars = 0
-
-                for page in sample_pages:
+                page_texts = {}
+                sample_sizes = []
+                for page_index, page in enumerate(sample_pages):
                     text = page.extract_text() or ""
-                    total_text_len += len(text.strip())
+                    page_texts[page_index] = text
+                    sample_sizes.append((text, page.width, page.height))
 
-                    # 예상 문자 수 (페이지 크기 기반 추정)
-                    width, height = page.width, page.height
-                    expected_chars = (width * height) / 100  # 대략적인 추정
-                    total_chars += expected_chars
+                is_digital, text_ratio = self._judge_pdf_text_density(sample_sizes)
+                return is_digital, text_ratio, page_texts
 
-                text_ratio = total_text_len / max(total_chars, 1)
+        except Exception:
+            return False, 0.0, {}
 
-                # 텍스트가 충분히 있으면 디지털 PDF
-                is_digital = total_text_len > 100 and text_ratio > 0.3
-                return is_digital, text_ratio
+    @staticmethod
+    def _pdf_text_blocks(fitz, page) -> List[Dict[str, Any]]:
+        """
+        PyMuPDF 페이지의 텍스트 블록 목록 (get_text("dict"))
 
-        except Exception:
-            return False, 0.0
+        기본 dict 모드는 이미지 블록마다 이미지 바이트 전체를 담으므로(스캔 PDF에서 매우 느림)
+        이미지 보존 플래그를 빼고 추출합니다. 이미지 블록은 변환에 쓰지 않습니다.
+        """
+        flags = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+        return page.get_text("dict", flags=flags)["blocks"]
 
-    def _convert_digital_pdf(self, file_path: str) -> str:
-        """디지털 PDF를 HTML로 변환 (로컬 처리)"""
-        try:
-            import pdfplumber
-        except ImportError:
+    @staticmethod
+    def _pdf_block_text(block: Dict[str, Any]) -> str:
+        """PyMuPDF 텍스트 블록(get_text("dict"))의 줄을 이어 텍스트로 변환"""
+        return '\n'.join(
+            ''.join(span["text"] for span in line["spans"])
+            for line in block["lines"]
+        )
+
+    @staticmethod
+    def _judge_pdf_text_density(samples: List[Tuple[str, float, float]]) -> Tuple[bool, float]:
+        """샘플 페이지 (텍스트, 너비, 높이)로 디지털 PDF 여부 판정"""
+        total_text_len = 0
+        total_chars = 0
+
+        for text, width, height in samples:
+            total_text_len += len(text.strip())
+
+            # 예상 문자 수 (페이지 크기 기반 추정)
+            expected_chars = (width * height) / 100  # 대략적인 추정
+            total_chars += expected_chars
+
+        text_ratio = total_text_len / max(total_chars, 1)
+
+        # 텍스트가 충분히 있으면 디지털 PDF
+        is_digital = total_text_len > 100 and text_ratio > 0.3
+        return is_digital, text_ratio
+
+    def _convert_digital_pdf(self, file_path: str, prefetched: Optional[Dict[int, Any]] = None) -> str:
+        """
+        디지털 PDF를 HTML로 변환 (로컬 처리)
+
+        PyMuPDF가 있으면 텍스트 블록(get_text("dict"))과 테이블 영역(find_tables)을
+        한 번씩만 추출하고, 테이블과 겹치는 텍스트 블록은 건너뜁니다.
+        없으면 pdfplumber로 변환합니다.
+
+        Args:
+            file_path: PDF 파일 경로
+            prefetched: _analyze_pdf에서 이미 추출한 샘플 페이지 데이터
+                (PyMuPDF는 텍스트 블록 목록, pdfplumber는 텍스트 - 분석과 같은 백엔드가 사용됨)
+        """
+        fitz = _import_pymupdf()
+        if fitz is None:
+            return self._convert_digital_pdf_plumber(file_path, prefetched)
+
+        html_parts = ['<div class="pdf-document">']
+
+        with fitz.open(file_path) as doc:
+            for page_num, page in enumerate(doc, 1):
+                html_parts.append(f'<div class="pdf-page" data-page="{page_num}">')
+
+                # 테이블 먼저 추출 (MuPDF 1.23+)
+                try:
+                    tables = page.find_tables().tables
+                except Exception:
+                    tables = []
+                table_bboxes = []
+
+                if tables:
+                    # 테이블 테두리 감지 (페이지에 선/도형이 있으면 테두리 있음)
+                    border_class = 'bordered' if page.get_drawings() else 'borderless'
+
+                for table in tables:
+                    rows = table.extract()
+                    if not rows:
+                        continue
+                    table_bboxes.append(fitz.Rect(table.bbox))
+
+                    html_parts.append(f'<table class="pdf-table {border_class}">')
+                    for row in rows:
+                        html_parts.append('<tr>')
+                        for cell in row:
+                            cell_text = self._clean_text(cell) if cell else ''
+                            html_parts.append(f'<td>{cell_text}</td>')
+                        html_parts.append('</tr>')
+                    html_parts.append('</table>')
+
+                # 일반 텍스트 추출 (분석 단계에서 추출한 페이지는 재사용, 테이블 영역과 겹치는 블록은 제외)
+                if prefetched and (page_num - 1) in prefetched:
+                    blocks = prefetched[page_num - 1]
+                else:
+                    blocks = self._pdf_text_blocks(fitz, page)
+
+                for block in blocks:
+                    if block.get("type") != 0:
+                        continue  # 이미지 블록
+                    if table_bboxes:
+                        block_rect = fitz.Rect(block["bbox"])
+                        if any(block_rect.intersects(bbox) for bbox in table_bboxes):
+                            continue
+
+                    text = self._clean_text(self._pdf_block_text(block))
+                    if text:
+                        html_parts.append(f'<p>{text}</p>')
+
+                html_parts.append('</div>')
+                html_parts.append('<hr class="page-break"/>')
+
+        html_parts.append('</div>')
+        return '\n'.join(html_parts)
+
+    def _convert_digital_pdf_plumber(self, file_path: str, prefetched: Optional[Dict[int, str]] = None) -> str:
+        """디지털 PDF를 HTML로 변환 (pdfplumber 사용, PyMuPDF 없을 때)"""
+        pdfplumber = _lazy_import('pdfplumber')
+        if pdfplumber is None:
             return "<p>pdfplumber 라이브러리가 필요합니다.</p>"
 
         html_parts = ['<div class="pdf-document">']
@@ -789,8 +1199,11 @@ class FileProcessor:
                             html_parts.append('</tr>')
                         html_parts.append('</table>')
 
-                # 일반 텍스트 추출
-                text = page.extract_text()
+                # 일반 텍스트 추출 (분석 단계에서 추출한 페이지는 재사용)
+                if prefetched and (page_num - 1) in prefetched:
+                    text = prefetched[page_num - 1]
+                else:
+                    text = page.extract_text()
                 if text:
                     # 테이블에 포함된 텍스트 제거 후 단락으로 분리
                     paragraphs = text.split('\n\n')
@@ -820,13 +1233,12 @@ class FileProcessor:
         """텍스트 정리"""
         if not text:
             return ""
-        # HTML 특수문자 이스케이프
-        text = text.replace('&', '&amp;')
-        text = text.replace('<', '&lt;')
-        text = text.replace('>', '&gt;')
-        # 연속 공백 정리
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        # 빠른 경로: 이스케이프할 문자도, 정리할 공백도 없으면 그대로
+        # (isprintable()은 일반 공백(' ')을 제외한 모든 공백 문자에서 False)
+        if '  ' not in text and text.isprintable() and not ('&' in text or '<' in text or '>' in text):
+            return text.strip()
+        # HTML 특수문자 이스케이프 + 연속 공백 정리
+        return _WS_RE.sub(' ', text.translate(_HTML_ESCAPE_TABLE)).strip()
 
     def _convert_image_pdf_upstage(self, file_path: str) -> str:
         """
@@ -851,18 +1263,34 @@ class FileProcessor:
         if file_size_mb > self.MAX_FILE_SIZE_MB:
             return f"<p>파일 크기가 너무 큽니다: {file_size_mb:.1f}MB (최대 {self.MAX_FILE_SIZE_MB}MB)</p>"
 
-        try:
-            from PyPDF2 import PdfReader, PdfWriter
-        except ImportError:
-            # 분할 없이 전체 업로드 (페이지 수 확인 불가)
-            return self._call_upstage_api(file_path)
+        # PDF 분할 라이브러리 선택 (pikepdf: qpdf C++ 백엔드 → 없으면 PyPDF2)
+        pikepdf = _lazy_import('pikepdf')
+        if pikepdf is not None:
+            # PDF 페이지 수 확인
+            try:
+                with pikepdf.open(file_path) as pdf:
+                    total_pages = len(pdf.pages)
+            except Exception as e:
+                return f"<p>PDF 파일을 읽을 수 없습니다: {str(e)}</p>"
 
-        # PDF 페이지 수 확인
-        try:
-            reader = PdfReader(file_path)
-            total_pages = len(reader.pages)
-        except Exception as e:
-            return f"<p>PDF 파일을 읽을 수 없습니다: {str(e)}</p>"
+            def write_chunk(start_page, end_page, chunk_path):
+                return self._write_pdf_chunk_pikepdf(file_path, start_page, end_page, chunk_path)
+        else:
+            try:
+                from PyPDF2 import PdfReader, PdfWriter
+            except ImportError:
+                # 분할 없이 전체 업로드 (페이지 수 확인 불가)
+                return self._call_upstage_api(file_path)
+
+            # PDF 페이지 수 확인
+            try:
+                reader = PdfReader(file_path)
+                total_pages = len(reader.pages)
+            except Exception as e:
+                return f"<p>PDF 파일을 읽을 수 없습니다: {str(e)}</p>"
+
+            def write_chunk(start_page, end_page, chunk_path):
+                return self._write_pdf_chunk(reader, PdfWriter, start_page, end_page, chunk_path)
 
         if total_pages == 0:
             return "<p>빈 PDF 파일입니다.</p>"
@@ -894,25 +1322,28 @@ class FileProcessor:
         # 시스템 임시 디렉토리 사용 (Windows 호환성)
         temp_dir = tempfile.mkdtemp(prefix='lawpro_pdf_')
 
-        try:
-            total_chunks = (total_pages + self.MAX_PDF_PAGES_PER_REQUEST - 1) // self.MAX_PDF_PAGES_PER_REQUEST
-
-            for chunk_idx, start_page in enumerate(range(0, total_pages, self.MAX_PDF_PAGES_PER_REQUEST)):
-                end_page = min(start_page + self.MAX_PDF_PAGES_PER_REQUEST, total_pages)
-                chunk_pages = end_page - start_page
-
-                # 부분 PDF 생성
-                writer = PdfWriter()
-                for i in range(start_page, end_page):
-                    writer.add_page(reader.pages[i])
+        # 분할 PDF 생성은 별도 스레드 1개에서 미리 진행하고,
+        # API 호출은 현재 스레드에서 순차 처리 (Upstage: 동시 요청 금지)
+        split_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-split")
 
+        try:
+            chunk_ranges = [
+                (start_page, min(start_page + self.MAX_PDF_PAGES_PER_REQUEST, total_pages))
+                for start_page in range(0, total_pages, self.MAX_PDF_PAGES_PER_REQUEST)
+            ]
+            split_futures = []
+            for chunk_idx, (start_page, end_page) in enumerate(chunk_ranges):
                 temp_path = os.path.join(temp_dir, f'chunk_{chunk_idx:03d}.pdf')
-                with open(temp_path, 'wb') as f:
-                    writer.write(f)
+                split_futures.append(split_executor.submit(write_chunk, start_page, end_page, temp_path))
                 temp_files.append(temp_path)
 
+            for (start_page, end_page), split_future in zip(chunk_ranges, split_futures):
+                chunk_pages = end_page - start_page
+
                 # API 호출 (429 발생 시 내부에서 충분히 대기 후 재시도)
                 try:
+                    # 부분 PDF 생성 완료 대기 (이전 청크 API 호출 중에 미리 생성됨)
+                    temp_path = split_future.result()
                     part_html = self._call_upstage_api(temp_path)
 
                     # 에러 응답 체크
@@ -933,6 +1364,8 @@ class FileProcessor:
                 self.credit_manager.deduct_credits(pages_processed, filename, CREDIT_PER_PAGE_OCR)
 
         finally:
+            split_executor.shutdown(wait=True, cancel_futures=True)
+
             # 임시 파일 정리 (지연 삭제로 Windows 파일 잠금 문제 해결)
             time_module.sleep(0.5)  # 파일 핸들 해제 대기
             try:
@@ -945,6 +1378,31 @@ class FileProcessor:
 
         return '\n'.join(html_parts)
 
+    @staticmethod
+    def _write_pdf_chunk_pikepdf(file_path: str, start_page: int, end_page: int, chunk_path: str) -> str:
+        """PDF의 [start_page, end_page) 페이지를 부분 PDF 파일로 저장 (pikepdf, 재압축 없음)"""
+        pikepdf = _lazy_import('pikepdf')
+
+        with pikepdf.open(file_path) as src, pikepdf.Pdf.new() as dst:
+            dst.pages.extend(src.pages[start_page:end_page])
+            dst.save(
+                chunk_path,
+                linearize=False,
+                object_stream_mode=pikepdf.ObjectStreamMode.preserve
+            )
+        return chunk_path
+
+    @staticmethod
+    def _write_pdf_chunk(reader, writer_class, start_page: int, end_page: int, chunk_path: str) -> str:
+        """PDF의 [start_page, end_page) 페이지를 부분 PDF 파일로 저장 (PyPDF2)"""
+        writer = writer_class()
+        for i in range(start_page, end_page):
+            writer.add_page(reader.pages[i])
+
+        with open(chunk_path, 'wb') as f:
+            writer.write(f)
+        return chunk_path
+
     def _call_upstage_api(self, file_path: str) -> str:
         """
         Upstage Document Parse API 호출
@@ -995,10 +1453,8 @@ class FileProcessor:
                         print(log_msg, file=sys.stderr, flush=True)
                         time_module.sleep(remaining)
 
-                    # Rate Limit 체크 (학습된 한도 기반 throttling)
-                    should_wait, wait_sec = self.rate_limiter.should_wait()
-                    if should_wait:
-                        time_module.sleep(wait_sec)
+                    # 선제적 속도 제한 (토큰 버킷, 429 전에 미리 속도를 맞춤)
+                    self.rate_limiter.acquire()
 
                     # 요청 기록
                     self.rate_limiter.record_request()
@@ -1006,7 +1462,7 @@ class FileProcessor:
                 with open(file_path, "rb") as f:
                     files = {"document": (filename, f)}
 
-                    response = requests.post(
+                    response = self._get_http_session().post(
                         self.UPSTAGE_API_URL,
                         headers=headers,
                         data=data,
@@ -1022,8 +1478,10 @@ class FileProcessor:
                         log_msg = self.rate_limiter.get_429_analysis_log(analysis)
                         print(log_msg, file=sys.stderr, flush=True)
 
-                        # 쿨다운 설정 (블로킹 없이 상태만 기록)
-                        wait_time, retry_count = self.rate_limiter.set_cooldown(filename)
+                        # 쿨다운 설정 (블로킹 없이 상태만 기록, 서버가 Retry-After를 주면 그 시간만 대기)
+                        retry_after = response.headers.get('Retry-After', '')
+                        retry_after = float(retry_after) if retry_after.isdigit() else None
+                        wait_time, retry_count = self.rate_limiter.set_cooldown(filename, retry_after=retry_after)
                         log_msg = self.rate_limiter.get_cooldown_log(wait_time, retry_count, filename)
                         print(log_msg, file=sys.stderr, flush=True)
 
@@ -1138,8 +1596,13 @@ class FileProcessor:
     # HTML 저장
     # ============================================================
     def _save_html(self, save_path: str, content: str, original_filename: str):
-        """완성된 HTML 저장"""
-        html_template = f'''<!DOCTYPE html>
+        """
+        완성된 HTML 저장
+
+        본문(content)을 템플릿 문자열에 합치지 않고 앞/본문/뒤를 차례로 기록합니다.
+        (대용량 문서에서 본문 크기만큼의 문자열 복사본을 만들지 않음)
+        """
+        html_head = f'''<!DOCTYPE html>
 <html lang="ko">
 <head>
     <meta charset="UTF-8">
@@ -1251,7 +1714,8 @@ class FileProcessor:
         <small style="color:#999;">Source: {original_filename}</small>
     </header>
     <main>
-{content}
+'''
+        html_tail = '''
     </main>
     <footer style="margin-top:3em; padding-top:1em; border-top:1px solid #eee; color:#999; font-size:0.8em;">
         Converted by LawPro Fast Converter
@@ -1260,4 +1724,29 @@ class FileProcessor:
 </html>'''
 
         with open(save_path, 'w', encoding='utf-8') as f:
-            f.write(html_template)
+            f.writelines((html_head, content, html_tail))
+
+
+# ============================================================
+# 로컬 변환 작업 프로세스
+# ============================================================
+_convert_worker: Optional[FileProcessor] = None
+
+
+def _init_convert_worker(preserve_excel_styles: bool):
+    """작업 프로세스 초기화 - 프로세스당 변환 전용 FileProcessor 한 번만 생성"""
+    global _convert_worker
+    _convert_worker = FileProcessor(
+        output_folder="",
+        generate_clean_html=False,
+        generate_markdown=False,
+        check_credits=False,
+        enable_gemini_correction=False,
+        preserve_excel_styles=preserve_excel_styles
+    )
+
+
+def _convert_in_worker(file_path: str) -> str:
+    """작업 프로세스에서 파일 하나를 HTML로 변환"""
+    ext = os.path.splitext(file_path)[1].lower()
+    return getattr(_convert_worker, _HANDLERS[ext])(file_path)
@@ -13,6 +13,10 @@ Upstage API Rate Limiter - 적응형 Rate Limit 학습 시스템
 4. 두 케이스의 중간값을 내부 Rate Limit으로 설정
 5. 요청 전 Rate Limit 초과 예상 시 자동 대기
 
+선제적 속도 제한 (토큰 버킷 + AIMD):
+- 요청 전 토큰 버킷에서 토큰 획득 (학습된 Rate Limit 속도로 보충)
+- 성공이 이어지면 속도를 조금씩 올리고, 429 발생 시 절반으로 낮춤
+
 쿨다운 시스템:
 - 429 발생 시 쿨다운 상태 기록 (블로킹 없이)
 - 다음 요청 시 쿨다운 잔여 시간만 대기
@@ -46,9 +50,17 @@ class RateLimitTracker:
     # 기본 Rate Limit (학습 전 초기값) - 분당 요청 수
     DEFAULT_RATE_LIMIT = 30  # 보수적으로 시작
 
-    # 429 재시도 대기 시간 (초)
+    # 429 재시도 대기 시간 (초) - 서버가 Retry-After를 주지 않을 때
     RETRY_DELAYS = [10, 30, 60, 120, 180]  # 10초, 30초, 1분, 2분, 3분
 
+    # 토큰 버킷 / AIMD 설정 (분당 요청 수 기준)
+    TOKEN_BUCKET_BURST = 2  # 연속 요청 허용 수
+    AIMD_INCREASE = 1.0  # 성공 구간마다 증가량 (가산)
+    AIMD_INCREASE_INTERVAL = 10  # 성공 요청 10회마다 증가
+    AIMD_DECREASE_RATIO = 0.5  # 429 발생 시 감소 비율 (승산)
+    MIN_RATE_LIMIT = 5
+    MAX_RATE_LIMIT = 120
+
     def __init__(self, data_dir: str = None):
         """
         Args:
@@ -82,6 +94,10 @@ class RateLimitTracker:
         # 저장된 데이터 로드
         self._load_data()
 
+        # === 선제적 속도 제한 (학습된 Rate Limit에서 시작, AIMD로 조정) ===
+        self.aimd_rate_limit = self.get_rate_limit()
+        self.token_bucket = TokenBucket(rate_per_minute=self.aimd_rate_limit, burst=self.TOKEN_BUCKET_BURST)
+
     def _load_data(self):
         """저장된 Rate Limit 데이터 로드"""
         try:
@@ -135,10 +151,24 @@ class RateLimitTracker:
         with self.lock:
             self.request_times.append(time.time())
 
+    def acquire(self):
+        """요청 전 호출 - 토큰 버킷에서 토큰 획득 (현재 AIMD 속도를 넘지 않도록 대기)"""
+        self.token_bucket.acquire()
+
+    def _set_aimd_rate_limit(self, rate_limit: float):
+        """AIMD 속도 변경 (분당 요청 수, 최소/최대값 범위로 제한)"""
+        rate_limit = min(max(rate_limit, self.MIN_RATE_LIMIT), self.MAX_RATE_LIMIT)
+        self.aimd_rate_limit = rate_limit
+        self.token_bucket.set_rate(rate_limit)
+
     def record_success(self):
         """성공 요청 기록 및 주기적 스냅샷"""
         self.success_count += 1
 
+        # 성공 구간마다 속도를 조금씩 올림 (가산 증가)
+        if self.success_count % self.AIMD_INCREASE_INTERVAL == 0:
+            self._set_aimd_rate_limit(self.aimd_rate_limit + self.AIMD_INCREASE)
+
         # 일정 간격마다 성공 케이스 스냅샷 저장
         if self.success_count % self.SUCCESS_SNAPSHOT_INTERVAL == 0:
             rates = self._calculate_rates()
@@ -175,6 +205,9 @@ class RateLimitTracker:
         # 새로운 Rate Limit 계산
         new_limit = self._calculate_new_rate_limit(current_rates, comparison)
 
+        # 속도를 절반으로 낮춤 (승산 감소, 학습값이 더 낮으면 학습값 사용)
+        self._set_aimd_rate_limit(min(self.aimd_rate_limit * self.AIMD_DECREASE_RATIO, new_limit))
+
         # 저장
         self.rate_data["learned_rate_limit"] = new_limit
         self.rate_data["last_updated"] = datetime.now().isoformat()
@@ -184,7 +217,8 @@ class RateLimitTracker:
             "current_rates": current_rates,
             "comparison": comparison,
             "new_rate_limit": new_limit,
-            "old_rate_limit": self.rate_data.get("learned_rate_limit", self.DEFAULT_RATE_LIMIT)
+            "old_rate_limit": self.rate_data.get("learned_rate_limit", self.DEFAULT_RATE_LIMIT),
+            "aimd_rate_limit": self.aimd_rate_limit
         }
 
     def _compare_with_success(self) -> Optional[Dict]:
@@ -272,6 +306,7 @@ class RateLimitTracker:
             "current_5min_avg": round(rates["rate_5min_avg"], 1),
             "current_10min_avg": round(rates["rate_10min_avg"], 1),
             "learned_limit": rate_limit,
+            "aimd_limit": self.aimd_rate_limit,
             "success_samples": len(self.rate_data.get("success_snapshots", [])),
             "failure_samples": len(self.rate_data.get("failure_snapshots", []))
         }, ensure_ascii=False)
@@ -291,7 +326,8 @@ class RateLimitTracker:
             "learned_limit": {
                 "old": analysis.get("old_rate_limit"),
                 "new": analysis["new_rate_limit"]
-            }
+            },
+            "aimd_limit": analysis.get("aimd_rate_limit")
         }
 
         if comparison:
@@ -308,20 +344,24 @@ class RateLimitTracker:
     # 쿨다운 시스템 (429 발생 시 비블로킹 대기)
     # ============================================================
 
-    def set_cooldown(self, filename: str = None) -> Tuple[float, int]:
+    def set_cooldown(self, filename: str = None, retry_after: Optional[float] = None) -> Tuple[float, int]:
         """
         429 발생 시 쿨다운 설정 (블로킹 없이 상태만 기록)
 
         Args:
             filename: 429 발생한 파일명 (로깅용)
+            retry_after: 서버가 알려준 대기 시간 (Retry-After 헤더, 초) - 있으면 고정 단계 대신 사용
 
         Returns:
             (wait_seconds, retry_count): 대기 시간과 재시도 횟수
         """
         with self.lock:
-            # 재시도 횟수에 따른 대기 시간 결정
-            delay_idx = min(self.cooldown_retry_count, len(self.RETRY_DELAYS) - 1)
-            wait_time = self.RETRY_DELAYS[delay_idx]
+            if retry_after is not None:
+                wait_time = retry_after
+            else:
+                # 재시도 횟수에 따른 대기 시간 결정
+                delay_idx = min(self.cooldown_retry_count, len(self.RETRY_DELAYS) - 1)
+                wait_time = self.RETRY_DELAYS[delay_idx]
 
             # 쿨다운 상태 설정
             self.cooldown_until = time.time() + wait_time
@@ -401,6 +441,72 @@ class RateLimitTracker:
         }, ensure_ascii=False)
 
 
+class TokenBucket:
+    """
+    토큰 버킷 방식의 선제적 요청 속도 제한기 (스레드 안전)
+
+    - 분당 rate_per_minute개 속도로 토큰이 채워지고, 최대 burst개까지 쌓임
+    - acquire(): 토큰이 부족할 때만 필요한 만큼 대기
+    - penalize(): 429 발생 시 토큰을 음수로 만들어 다음 요청을 늦춤
+      (slow_for 지정 시 그 시간 동안 보충 속도를 절반으로 낮춤)
+    """
+
+    MIN_RATE_RATIO = 1 / 8  # 연속 429 시 속도 하한 (기본 속도 대비)
+
+    def __init__(self, rate_per_minute: float = 60, burst: int = 10):
+        self.base_rate = rate_per_minute / 60.0  # 초당 토큰
+        self.rate = self.base_rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        self.slow_until = 0.0  # 감속 종료 시각 (monotonic)
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        """경과 시간만큼 토큰 보충 (lock 보유 상태에서 호출)"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+        # 감속 기간이 끝나면 기본 속도로 복구
+        if self.rate != self.base_rate and now >= self.slow_until:
+            self.rate = self.base_rate
+
+    def acquire(self, tokens: float = 1):
+        """토큰 획득 (부족하면 채워질 때까지 대기)"""
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait_time = (tokens - self.tokens) / self.rate
+
+            time.sleep(wait_time)
+
+    def set_rate(self, rate_per_minute: float):
+        """기본 보충 속도 변경 (AIMD 등 외부 조정용)"""
+        with self.lock:
+            self._refill()
+            self.base_rate = rate_per_minute / 60.0
+            if time.monotonic() >= self.slow_until:
+                self.rate = self.base_rate
+
+    def penalize(self, slow_for: float = 0):
+        """
+        429 발생 시 호출 - 보유 토큰을 -1 이하로 낮춤
+
+        Args:
+            slow_for: 0보다 크면 이 시간(초) 동안 보충 속도를 절반으로 낮춤 (연속 호출 시 누적)
+        """
+        with self.lock:
+            self._refill()
+            self.tokens = min(self.tokens, -1)
+            if slow_for > 0:
+                self.rate = max(self.rate / 2, self.base_rate * self.MIN_RATE_RATIO)
+                self.slow_until = time.monotonic() + slow_for
+
+
 # 싱글톤 인스턴스
 _rate_limiter_instance = None
 
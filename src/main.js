@@ -38,6 +38,7 @@ const store = new Store({
         generateCleanHtml: true,
         generateMarkdown: true,
         enableGeminiCorrection: true,  // Gemini 3.0 Flash 자동 교정 (이미지 PDF 변환 시)
+        preserveExcelStyles: true,  // Excel 셀 서식 보존 (false면 값만 빠르게 변환)
         theme: 'dark'
     }
 });
@@ -206,6 +207,9 @@ ipcMain.handle('start-conversion', async (event, { folderPath, apiKey, generateC
         const geminiKey = store.get('geminiKey', '') || process.env.GEMINI_API_KEY || '';
         const enableGeminiCorrection = store.get('enableGeminiCorrection', true);
 
+        // Excel 서식 옵션
+        const preserveExcelStyles = store.get('preserveExcelStyles', true);
+
         // Python 프로세스 시작 (추가 인자 포함)
         const args = [
             scriptPath,
@@ -214,7 +218,8 @@ ipcMain.handle('start-conversion', async (event, { folderPath, apiKey, generateC
             cleanOpt ? 'true' : 'false',
             mdOpt ? 'true' : 'false',
             geminiKey,
-            enableGeminiCorrection ? 'true' : 'false'
+            enableGeminiCorrection ? 'true' : 'false',
+            preserveExcelStyles ? 'true' : 'false'
         ];
 
         pythonProcess = spawn(pythonCmd, args, {
@@ -227,7 +232,14 @@ ipcMain.handle('start-conversion', async (event, { folderPath, apiKey, generateC
             for (const line of lines) {
                 try {
                     const json = JSON.parse(line);
-                    mainWindow?.webContents.send('conversion-log', json);
+                    if (json.type === 'progress_batch') {
+                        // 묶음 진행 메시지는 렌더러에 개별 progress로 풀어서 전달
+                        for (const item of json.items || []) {
+                            mainWindow?.webContents.send('conversion-log', { type: 'progress', ...item });
+                        }
+                    } else {
+                        mainWindow?.webContents.send('conversion-log', json);
+                    }
                 } catch (e) {
                     // JSON이 아닌 출력은 로그로 처리
                     mainWindow?.webContents.send('conversion-log', {
@@ -425,6 +437,16 @@ ipcMain.handle('get-gemini-correction', async () => {
     return store.get('enableGeminiCorrection', true);
 });
 
+// Excel 셀 서식 보존 설정 (변환 시 적용)
+ipcMain.handle('set-excel-styles', async (event, enabled) => {
+    store.set('preserveExcelStyles', enabled);
+    return { success: true };
+});
+
+ipcMain.handle('get-excel-styles', async () => {
+    return store.get('preserveExcelStyles', true);
+});
+
 // Gemini 검수 실행
 ipcMain.handle('run-gemini-review', async (event, { folderPath }) => {
     return new Promise((resolve, reject) => {
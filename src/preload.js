@@ -66,6 +66,13 @@ contextBridge.exposeInMainWorld('lawpro', {
     getGeminiCorrection: () =>
         ipcRenderer.invoke('get-gemini-correction'),
 
+    // Excel 셀 서식 보존 설정
+    setExcelStyles: (enabled) =>
+        ipcRenderer.invoke('set-excel-styles', enabled),
+
+    getExcelStyles: () =>
+        ipcRenderer.invoke('get-excel-styles'),
+
     // ========================================
     // OpenAI 설정 및 실행
     // ========================================